@@ -1,6 +1,8 @@
 import os
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
+
+from pydantic import BaseModel
 
 from app.calendar.provider import select_calendar_provider
 from app.calendar.types import Event
@@ -253,7 +255,7 @@ def attach_memory_to_meetings(meetings: List[Dict[str, Any]]) -> List[Dict[str,
     events_today = []
     for meeting in meetings:
         # Handle both dict and Pydantic model
-        if hasattr(meeting, 'model_dump'):
+        if isinstance(meeting, BaseModel):
             # Pydantic model
             meeting_dict = meeting.model_dump()
             subject = meeting_dict.get("subject", "")
@@ -284,7 +286,7 @@ def attach_memory_to_meetings(meetings: List[Dict[str, Any]]) -> List[Dict[str,
     # Attach memory to meetings
     for meeting in meetings:
         # Handle both dict and Pydantic model
-        if hasattr(meeting, 'model_dump'):
+        if isinstance(meeting, BaseModel):
             # Pydantic model - convert to dict for processing
             meeting_dict = meeting.model_dump()
             profile = get_profile()
@@ -316,3 +318,46 @@ def attach_memory_to_meetings(meetings: List[Dict[str, Any]]) -> List[Dict[str,
                 }
 
     return meetings
+
+
+def attach_memory_to_meeting(meeting: Union[Dict[str, Any], BaseModel]) -> Union[Dict[str, Any], BaseModel]:
+    """
+    Attach memory data to a single meeting (single-event preview path).
+
+    Resolves the meeting's company once and looks up only that key in the
+    recent-meeting map, instead of building a batch of events and re-reading
+    the profile per meeting. No provider lookup happens when no company is found.
+
+    Args:
+        meeting: Meeting dictionary or Pydantic model
+
+    Returns:
+        The same meeting with memory data attached
+    """
+    if not meeting:
+        return meeting
+
+    meeting_dict = meeting.model_dump() if isinstance(meeting, BaseModel) else meeting
+
+    profile = get_profile()
+    company = _extract_company_from_meeting(meeting_dict, profile.company_aliases)
+
+    previous_meetings: List[Dict[str, Any]] = []
+    if company:
+        event = Event(
+            subject=meeting_dict.get("subject", ""),
+            start_time=meeting_dict.get("start_time", ""),
+            end_time="",  # Not needed for memory
+            location=meeting_dict.get("location"),
+            attendees=[],
+            notes=None
+        )
+        previous_meetings = fetch_recent_meetings([event]).get(company, [])
+
+    memory = {"previous_meetings": previous_meetings}
+    if isinstance(meeting, BaseModel):
+        meeting.memory = memory  # type: ignore[attr-defined]
+    else:
+        meeting["memory"] = memory
+
+    return meeting
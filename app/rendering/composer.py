@@ -4,6 +4,8 @@ from datetime import datetime
 from html import escape
 from typing import Any, Dict, List, Optional
 
+from pydantic import BaseModel
+
 
 def truncate(text: str, max_chars: int) -> str:
     if max_chars <= 0:
@@ -30,7 +32,7 @@ def compose_digest_model(
     for m in meetings:
         md = m
         # Allow pydantic models
-        if hasattr(m, "model_dump"):
+        if isinstance(m, BaseModel):
             md = m.model_dump()
         # Ensure all template-expected keys exist
         normalized_meetings.append(
@@ -3,26 +3,32 @@ import re
 import logging
 import uuid
 import time
+from collections import defaultdict
 from datetime import datetime
-from typing import Dict, Any, Literal, Optional, List, Tuple
-from urllib.parse import urlparse
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Dict, Any, Iterable, Iterator, Literal, Mapping, Optional, List, Tuple, Union
+from urllib.parse import urlsplit
 from zoneinfo import ZoneInfo
 
 from fastapi import HTTPException
+from pydantic import BaseModel
 
 from app.calendar.provider import select_calendar_provider
-from app.calendar.types import Event, Attendee
+from app.calendar.types import Event
 from app.data.sample_digest import SAMPLE_MEETINGS, STUB_MEETINGS_RAW_GRAPH
 from app.rendering.digest_renderer import _today_et_str, _format_date_et_str, _get_timezone
 from app.enrichment.service import enrich_meetings
 from app.profile.store import get_profile
-from app.memory.service import attach_memory_to_meetings
+from app.memory.service import attach_memory_to_meetings, attach_memory_to_meeting
 from app.research.config import (
     MAX_TAVILY_CALLS_PER_REQUEST,
     MAX_RESEARCH_SOURCES,
     ResearchBudget,
     get_confidence_min,
+    get_research_cache_ttl_seconds,
 )
+from app.utils.cache import research_result_cache
 from app.research.query_safety import sanitize_research_query, is_query_usable_after_sanitization
 from app.research.trace import (
     build_research_trace,
@@ -37,18 +43,27 @@ from app.research.confidence import (
     is_domain_generic,
     is_domain_ambiguous_short,
     is_meeting_like_test,
+    subject_features,
 )
 from app.research.anchor_utils import (
     is_consumer_domain,
     domain_to_org_name,
+    extract_org_from_subject,
+    org_from_email_domain,
     looks_like_personal_domain,
     looks_like_assistant_domain,
     DOMAIN_ORG_OVERRIDES,
 )
+# Imported as a module so selector functions stay patchable at app.research.selector.*
+from app.research import selector as research_selector
 
 logger = logging.getLogger(__name__)
 
+# Word tokens of a meeting subject (used for primary-domain tie-breaks)
+_WORD_RE = re.compile(r"\w+")
 
+
+@lru_cache(maxsize=4096)
 def _normalize_url_for_dedup(url: str) -> str:
     """
     Normalize URL for deduplication: trim, lowercase scheme/host, remove trailing slash.
@@ -100,30 +115,121 @@ def _dedupe_and_cap_sources(sources: List[Dict[str, Any]], max_items: int = 5) -
     return deduped
 
 
+# scheme://[userinfo@]host[:port]... -> host in a single scan: the greedy userinfo group stops at
+# the last "@" of the authority, and the host stops at the port ":" (or is a bracketed IPv6 literal)
+_URL_HOST_RE = re.compile(r"^[^:/?#]*://(?:[^/?#]*@)?(\[[^\]/?#]*\]|[^/?#:]*)")
+
+
 def _host_from_url(url: str) -> str:
     """Return lowercase hostname from URL (no port, no path). Empty if parse fails."""
+    # Guard before the cache so non-str (possibly unhashable) input still yields ""
     if not url or not isinstance(url, str):
         return ""
-    try:
-        parsed = urlparse(url.strip())
-        host = (parsed.hostname or "").strip().lower()
-        return host
-    except Exception:
-        return ""
+    return _host_from_url_cached(url)
+
+
+@lru_cache(maxsize=4096)
+def _host_from_url_cached(url: str) -> str:
+    """Memoized body of _host_from_url; url is a non-empty str."""
+    u = url.strip()
+    m = _URL_HOST_RE.match(u)
+    if m is None:
+        # Uncommon shape (e.g. scheme-relative "//host/path"): defer to urlsplit
+        try:
+            return (urlsplit(u).hostname or "").strip().lower()
+        except Exception:
+            return ""
+    host = m.group(1)
+    if host.startswith("["):
+        # IPv6 literal, e.g. [::1]:8080 -> ::1 (unterminated bracket -> "")
+        return host[1:-1].lower() if host.endswith("]") else ""
+    return host.strip().lower()
+
+
+@lru_cache(maxsize=4096)
+def _split_rev(name: str) -> Tuple[str, ...]:
+    """Canonical reversed labels of a host/domain (e.g. "News.Example.com." -> ("com", "example", "news"))."""
+    return tuple(reversed(name.lower().strip(".").split(".")))
+
+
+class ReverseDomainTrie:
+    """
+    Set of expected domains stored as reversed labels (com -> example -> ...) in nested dicts.
+    match(host) walks the host's labels once, so checking a host against many expected
+    domains costs O(labels) instead of one suffix comparison per domain.
+    A domain added with a leading "." (e.g. ".example.com") matches subdomains only.
+    """
+    __slots__ = ("_root", "_size")
+
+    # Node key holding (domain, subdomains_only) for a registered domain; never a valid label
+    _END = "$"
+
+    def __init__(self, domains: Iterable[str] = ()):
+        self._root: Dict[str, Any] = {}
+        self._size = 0
+        for d in domains:
+            self.add(d)
+
+    def add(self, domain: str) -> None:
+        if not domain or not isinstance(domain, str):
+            return
+        d = domain.strip().lower()
+        subdomains_only = d.startswith(".")
+        rev_labels = _split_rev(d)
+        if not rev_labels[-1]:
+            return
+        node = self._root
+        for label in rev_labels:
+            node = node.setdefault(label, {})
+        if self._END not in node:
+            self._size += 1
+        node[self._END] = (d, subdomains_only)
+
+    def match(self, host: str) -> Optional[str]:
+        """Return the deepest registered domain that host equals or is a subdomain of, else None."""
+        if not host:
+            return None
+        rev_labels = _split_rev(host)
+        node = self._root
+        best: Optional[str] = None
+        remaining = len(rev_labels)
+        for label in rev_labels:
+            child: Optional[Dict[str, Any]] = node.get(label)
+            if child is None:
+                break
+            node = child
+            remaining -= 1
+            end = node.get(self._END)
+            if end is not None and (remaining > 0 or not end[1]):
+                best = end[0]
+        return best
+
+    def __len__(self) -> int:
+        return self._size
 
 
 def _result_domain_match_host_based(
-    sources: List[Dict[str, Any]], expected_domain: str
+    sources: List[Dict[str, Any]], expected_domain: Union[str, ReverseDomainTrie]
 ) -> Tuple[bool, Optional[str], List[str]]:
     """
     Strict host-based domain match: hostname must equal expected_domain or end with .expected_domain.
+    expected_domain may also be a ReverseDomainTrie to match against several expected domains at once.
     Returns (matched, first_matching_hostname_or_none, top_source_hosts up to 5).
     """
-    if not expected_domain or not isinstance(expected_domain, str):
-        return False, None, []
-    domain_lower = expected_domain.strip().lower()
-    if not domain_lower:
-        return False, None, []
+    trie: Optional[ReverseDomainTrie] = None
+    domain_lower = suffix = ""
+    if isinstance(expected_domain, ReverseDomainTrie):
+        if not expected_domain:
+            return False, None, []
+        trie = expected_domain
+    else:
+        if not expected_domain or not isinstance(expected_domain, str):
+            return False, None, []
+        domain_lower = expected_domain.strip().lower()
+        if not domain_lower:
+            return False, None, []
+        # Loop-invariant suffix: ".example.com" (or expected_domain itself when it already starts with ".")
+        suffix = domain_lower if domain_lower.startswith(".") else "." + domain_lower
     hosts: List[str] = []
     first_matching_host: Optional[str] = None
     for s in sources:
@@ -135,15 +241,27 @@ def _result_domain_match_host_based(
             continue
         if len(hosts) < 5:
             hosts.append(host)
-        if host == domain_lower or (domain_lower.startswith(".") and host.endswith(domain_lower)) or (
-            not domain_lower.startswith(".") and host.endswith("." + domain_lower)
-        ):
-            if first_matching_host is None:
+        if first_matching_host is None:
+            if trie is not None:
+                if trie.match(host) is not None:
+                    first_matching_host = host
+            elif host == domain_lower or host.endswith(suffix):
                 first_matching_host = host
     matched = first_matching_host is not None
     return matched, first_matching_host, hosts
 
 
+def _top_source_hosts(sources: List[Dict[str, Any]], limit: int = 5) -> List[str]:
+    """Hostnames of the first `limit` sources, skipping non-dict sources and unparseable URLs."""
+    hosts: List[str] = []
+    for s in sources[:limit]:
+        if isinstance(s, dict):
+            host = _host_from_url(s.get("url") or "")
+            if host:
+                hosts.append(host)
+    return hosts
+
+
 def _is_ambiguous_acronym_domain(expected_domain: str) -> bool:
     """True if leftmost segment (e.g. 'smg' from 'smg.com') has length <= 4."""
     if not expected_domain or not isinstance(expected_domain, str):
@@ -155,28 +273,42 @@ def _is_ambiguous_acronym_domain(expected_domain: str) -> bool:
 
 # Negative terms that indicate off-target (e.g. Scotts Miracle-Gro ticker) for ambiguous acronym guardrail
 _NEGATIVE_TERMS_AMBIGUOUS = ("scotts", "miracle-gro", "stock", "ticker")
+_NEGATIVE_TERMS_AMBIGUOUS_RE = re.compile(
+    "|".join(re.escape(t) for t in _NEGATIVE_TERMS_AMBIGUOUS), re.IGNORECASE
+)
 
 
-def _negative_term_hit_in_sources(
-    research_result: Dict[str, Any],
-    terms: Tuple[str, ...] = _NEGATIVE_TERMS_AMBIGUOUS,
-    top_n: int = 5,
-) -> bool:
-    """True if any of the terms appear (case-insensitive) in summary, key_points, or top N source titles."""
-    texts: List[str] = []
+def _iter_texts(research_result: Dict[str, Any], top_n: int) -> Iterable[str]:
+    """Yield summary, then top N key_points, then top N source titles (stripped, non-empty), lazily."""
     summary = (research_result.get("summary") or "").strip()
     if summary:
-        texts.append(summary)
+        yield summary
     for kp in (research_result.get("key_points") or [])[:top_n]:
-        if isinstance(kp, str) and kp.strip():
-            texts.append(kp.strip())
+        if isinstance(kp, str):
+            kp = kp.strip()
+            if kp:
+                yield kp
     for s in (research_result.get("sources") or [])[:top_n]:
         if isinstance(s, dict):
             t = (s.get("title") or "").strip()
             if t:
-                texts.append(t)
-    combined = " ".join(texts).lower()
-    return any(term in combined for term in terms)
+                yield t
+
+
+def _negative_term_hit_in_sources(
+    research_result: Dict[str, Any],
+    terms: Tuple[str, ...] = _NEGATIVE_TERMS_AMBIGUOUS,
+    top_n: int = 5,
+) -> bool:
+    """True if any of the terms appear (case-insensitive) in summary, key_points, or top N source titles."""
+    if not terms:
+        return False
+    if terms is _NEGATIVE_TERMS_AMBIGUOUS:
+        terms_re = _NEGATIVE_TERMS_AMBIGUOUS_RE
+    else:
+        terms_re = re.compile("|".join(re.escape(t) for t in terms), re.IGNORECASE)
+    # Single alternation scan per block; stops at the first hit
+    return any(terms_re.search(block) for block in _iter_texts(research_result, top_n))
 
 
 def _entity_match_in_sources(
@@ -191,30 +323,47 @@ def _entity_match_in_sources(
     Used for ambiguous acronym domains to avoid wrong-entity (e.g. SMG ticker vs Service Management Group).
     When require_org_for_ambiguous=True, only org_display is considered (short anchor e.g. "SMG" is ignored).
     """
-    texts: List[str] = []
-    summary = (research_result.get("summary") or "").strip()
-    if summary:
-        texts.append(summary)
-    for kp in (research_result.get("key_points") or [])[:top_n]:
-        if isinstance(kp, str) and kp.strip():
-            texts.append(kp.strip())
-    sources = research_result.get("sources") or []
-    for s in sources[:top_n]:
-        if isinstance(s, dict):
-            t = (s.get("title") or "").strip()
-            if t:
-                texts.append(t)
     anchor_lower = (anchor_display or "").strip().lower()
     org_lower = (org_display or "").strip().lower()
     # For ambiguous acronym domains we require full org name; short anchor (e.g. "SMG") must not count
     allow_anchor = not require_org_for_ambiguous or (len((anchor_display or "").strip()) > 4)
-    for block in texts:
-        bl = block.lower()
-        if allow_anchor and anchor_lower and anchor_lower in bl:
-            return True
-        if org_lower and org_lower in bl:
-            return True
-    return False
+    entity_re = _entity_pattern(anchor_lower if allow_anchor else "", org_lower)
+    if entity_re is None:
+        return False
+    # One case-insensitive alternation scan per block instead of lowercasing + two substring checks
+    return any(entity_re.search(block) for block in _iter_texts(research_result, top_n))
+
+
+@lru_cache(maxsize=256)
+def _entity_pattern(anchor_lower: str, org_lower: str) -> Optional["re.Pattern[str]"]:
+    """Compiled case-insensitive alternation of anchor/org; cached so the retry check reuses it."""
+    patterns = [re.escape(p) for p in (anchor_lower, org_lower) if p]
+    if not patterns:
+        return None
+    return re.compile("|".join(patterns), re.IGNORECASE)
+
+
+# Deletes "-" and "_" in one pass when normalising a domain segment for override lookup
+_STRIP_DASH_UNDER = str.maketrans("", "", "-_")
+
+
+@lru_cache(maxsize=1024)
+def _domain_intrinsic_score(d: str) -> int:
+    """Domain-only part of the primary-domain score (known org bonus, personal/assistant penalties, TLD bonus)."""
+    segment = d.split(".", 1)[0].lower().translate(_STRIP_DASH_UNDER) if "." in d else d.lower()
+    tld = d.split(".")[-1].lower() if "." in d else ""
+    score = 0
+    if segment in DOMAIN_ORG_OVERRIDES:
+        score += 50
+    if looks_like_personal_domain(d):
+        score -= 40
+    if looks_like_assistant_domain(d):
+        score -= 30
+    if tld == "org":
+        score += 5
+    if tld == "com":
+        score += 3
+    return score
 
 
 def _compute_meeting_anchor_and_query(
@@ -246,7 +395,7 @@ def _compute_meeting_anchor_and_query(
     subject = (meeting_data.get("subject") or meeting_data.get("title") or "").strip()
     exec_name_lower = exec_name.strip().lower() if exec_name else ""
     exec_mailbox_lower = (exec_mailbox or "").strip().lower()
-    subject_tokens = set(re.findall(r"\w+", subject.lower())) if subject else set()
+    subject_tokens = frozenset(_WORD_RE.findall(subject.lower())) if subject else frozenset()
 
     anchor = ""
     org_context = ""
@@ -265,7 +414,7 @@ def _compute_meeting_anchor_and_query(
 
     # Build external attendees (non-internal, non-consumer only) and domain counts
     external_attendees: List[Dict[str, Any]] = []
-    domain_counts: Dict[str, int] = {}
+    domain_counts: Dict[str, int] = defaultdict(int)
     for a in meeting_data.get("attendees") or []:
         ad = _normalize_attendee(a)
         if not isinstance(ad, dict):
@@ -273,42 +422,41 @@ def _compute_meeting_anchor_and_query(
         dom = _domain_from_email(ad.get("email") or ad.get("address"))
         if not dom or dom == "rpck.com" or is_consumer_domain(dom):
             continue
-        domain_counts[dom] = domain_counts.get(dom, 0) + 1
+        domain_counts[dom] += 1
         display_name = (ad.get("display_name") or ad.get("name") or "").strip()
         if display_name:
             has_attendee_display_name = True
             if not person_name_for_fallback:
                 person_name_for_fallback = display_name
-        external_attendees.append({"name": display_name, "domain": dom, "data": ad})
+        external_attendees.append(
+            {"name": display_name, "name_lower": display_name.lower(), "domain": dom, "data": ad}
+        )
 
     if is_org_external_non_consumer:
-        domain_counts[org_domain] = domain_counts.get(org_domain, 0) + 1
+        domain_counts[org_domain] += 1
+
+    # Per-domain risk flags (personal-looking or assistant-looking), computed once and reused by every ladder step
+    risky_domains = {
+        d: looks_like_personal_domain(d) or looks_like_assistant_domain(d) for d in domain_counts
+    }
+    all_risky = bool(risky_domains) and all(risky_domains.values())
 
     def _domain_score(d: str) -> int:
         """Score domain for primary selection; higher = prefer. Avoids personal/assistant domains."""
-        segment = d.split(".", 1)[0].lower().replace("-", "").replace("_", "") if "." in d else d.lower()
-        tld = d.split(".")[-1].lower() if "." in d else ""
-        count = domain_counts.get(d, 0)
-        score = count * 10
-        if segment in DOMAIN_ORG_OVERRIDES:
-            score += 50
-        if looks_like_personal_domain(d):
-            score -= 40
-        if looks_like_assistant_domain(d):
-            score -= 30
-        if tld == "org":
-            score += 5
-        if tld == "com":
-            score += 3
-        return score
+        return domain_counts.get(d, 0) * 10 + _domain_intrinsic_score(d)
 
     def _pick_primary_domain() -> str:
         """Choose primary_domain by score (prefer known orgs, avoid personal/assistant); tie-break: organizer, subject, alphabetical."""
         if not domain_counts:
             return primary_domain or ""
-        scored = [(d, _domain_score(d)) for d in domain_counts]
-        best_score = max(s for _, s in scored)
-        candidates = [d for d, s in scored if s == best_score]
+        best_score: Optional[int] = None
+        candidates: List[str] = []
+        for d in domain_counts:
+            s = _domain_score(d)
+            if best_score is None or s > best_score:
+                best_score, candidates = s, [d]
+            elif s == best_score:
+                candidates.append(d)
         if len(candidates) == 1:
             return candidates[0]
         if is_org_external_non_consumer and org_domain in candidates:
@@ -319,8 +467,9 @@ def _compute_meeting_anchor_and_query(
                 return d
         return sorted(candidates)[0]
 
+    picked_primary_domain = _pick_primary_domain() if domain_counts else ""
     if not primary_domain and domain_counts:
-        primary_domain = _pick_primary_domain()
+        primary_domain = picked_primary_domain
     if is_org_external_non_consumer and not primary_domain:
         primary_domain = org_domain
 
@@ -346,9 +495,9 @@ def _compute_meeting_anchor_and_query(
         person_data = external_attendees[0]
         person_name = person_data["name"]
         if person_name:
-            candidate_lower = person_name.lower()
+            candidate_lower = person_data["name_lower"]
             if not (exec_name_lower and candidate_lower == exec_name_lower):
-                if not exec_mailbox_lower or exec_mailbox_lower not in (candidate_lower or ""):
+                if not exec_mailbox_lower or exec_mailbox_lower not in candidate_lower:
                     anchor = person_name
                     anchor_type_str = AnchorType.PERSON.value
                     anchor_source_str = AnchorSource.ATTENDEE.value
@@ -370,11 +519,7 @@ def _compute_meeting_anchor_and_query(
 
     # If anchor came only from subject and ALL domains are personal/assistant, avoid wrong-entity: clear anchor
     if anchor and anchor_from_subject and domain_counts:
-        all_risky_subject = all(
-            looks_like_personal_domain(d) or looks_like_assistant_domain(d)
-            for d in domain_counts
-        )
-        if all_risky_subject:
+        if all_risky:
             anchor = ""
             anchor_type_str = None
             anchor_source_str = None
@@ -390,17 +535,13 @@ def _compute_meeting_anchor_and_query(
 
     # e) First external attendee (person or domain); skip when only risky domains (avoid wrong-entity).
     # When multiple external non-consumer domains: use only org/domain anchor, never person name.
-    all_risky_for_attendees = all(
-        looks_like_personal_domain(d) or looks_like_assistant_domain(d)
-        for d in domain_counts
-    ) if domain_counts else False
     if not anchor:
         for person_data in external_attendees:
             dom = person_data["domain"]
-            if all_risky_for_attendees and (looks_like_personal_domain(dom) or looks_like_assistant_domain(dom)):
+            if all_risky and risky_domains[dom]:
                 continue
             display_name = person_data["name"]
-            candidate_lower = (display_name or "").lower()
+            candidate_lower = person_data["name_lower"]
             if exec_name_lower and candidate_lower == exec_name_lower:
                 continue
             if exec_mailbox_lower and display_name and exec_mailbox_lower in candidate_lower:
@@ -420,7 +561,7 @@ def _compute_meeting_anchor_and_query(
                     anchor_source_str = AnchorSource.ATTENDEE.value
             else:
                 # Multiple domains: only domain-level anchor; skip personal/assistant domains
-                if looks_like_personal_domain(dom) or looks_like_assistant_domain(dom):
+                if risky_domains[dom]:
                     continue
                 if attendee_org:
                     anchor = attendee_org
@@ -433,16 +574,12 @@ def _compute_meeting_anchor_and_query(
 
     # Domain fallback: when we have external non-consumer domains but no anchor yet, pick primary and build org query
     if not anchor and domain_counts:
-        primary_domain = _pick_primary_domain()
+        primary_domain = picked_primary_domain
         # Prefer skipping over wrong-entity anchors: if ALL domains are personal-like or assistant-like, do not anchor
-        all_risky = all(
-            looks_like_personal_domain(d) or looks_like_assistant_domain(d)
-            for d in domain_counts
-        )
         if not all_risky:
             org_name = domain_to_org_name(primary_domain)
             # Use anchor only if chosen primary is not personal/assistant (scoring already prefers orgs)
-            if org_name and not looks_like_personal_domain(primary_domain) and not looks_like_assistant_domain(primary_domain):
+            if org_name and not risky_domains[primary_domain]:
                 anchor = org_name
                 anchor_type_str = AnchorType.DOMAIN.value
                 anchor_source_str = AnchorSource.ATTENDEE.value
@@ -453,6 +590,8 @@ def _compute_meeting_anchor_and_query(
 
     CONF_MIN = get_confidence_min()
     has_external = bool(primary_domain and primary_domain != "rpck.com")
+    # Subject/test signals are the same for the primary score and every fallback score
+    subject_feats = subject_features(meeting_data, exec_mailbox or None)
 
     primary_conf = compute_confidence(
         meeting_data=meeting_data,
@@ -463,6 +602,7 @@ def _compute_meeting_anchor_and_query(
         has_external_domain=has_external,
         has_attendee_display_name=has_attendee_display_name,
         mailbox=exec_mailbox or None,
+        features=subject_feats,
     )
 
     has_comma_first_last = "," in anchor and len(anchor.split(",")) == 2
@@ -505,6 +645,7 @@ def _compute_meeting_anchor_and_query(
                 has_external_domain=has_external,
                 has_attendee_display_name=has_attendee_display_name,
                 mailbox=exec_mailbox or None,
+                features=subject_feats,
             )
             if conf_fallback_a >= CONF_MIN:
                 chosen_query = fallback_a_query
@@ -528,6 +669,7 @@ def _compute_meeting_anchor_and_query(
                     has_external_domain=has_external,
                     has_attendee_display_name=has_attendee_display_name,
                     mailbox=exec_mailbox or None,
+                    features=subject_feats,
                 )
                 if conf_fallback_b >= CONF_MIN:
                     chosen_query = fallback_b_query
@@ -552,6 +694,7 @@ def _compute_meeting_anchor_and_query(
                 has_external_domain=True,
                 has_attendee_display_name=has_attendee_display_name,
                 mailbox=exec_mailbox or None,
+                features=subject_feats,
             )
             if conf_fallback_d >= CONF_MIN:
                 chosen_query = fallback_d_query
@@ -573,6 +716,13 @@ def _compute_meeting_anchor_and_query(
     }
 
 
+# Key-point classifier for question generation (case-insensitive)
+_KEY_POINT_CLASSIFIER_RE = re.compile(
+    r"(?P<news>recent|announced)|(?P<funding>raised|funding)|(?P<deal>partnership|acquisition)",
+    re.IGNORECASE,
+)
+
+
 def _transform_research_to_meeting_fields(research_result: Dict[str, Any]) -> Dict[str, Any]:
     """
     Transform research_result into per-meeting fields: context_summary, news, industry_signal,
@@ -587,6 +737,15 @@ def _transform_research_to_meeting_fields(research_result: Dict[str, Any]) -> Di
     """
     key_points = research_result.get("key_points", []) or []
     sources = research_result.get("sources", []) or []
+    if not key_points and not sources:
+        # Common when research failed or was skipped; nothing to derive
+        return {
+            "context_summary": None,
+            "news": [],
+            "industry_signal": None,
+            "strategic_angles": [],
+            "high_leverage_questions": [],
+        }
     
     # context_summary: 1-2 bullets from key_points
     context_summary = None
@@ -609,8 +768,7 @@ def _transform_research_to_meeting_fields(research_result: Dict[str, Any]) -> Di
             if not title:
                 # Derive title from URL host
                 try:
-                    from urllib.parse import urlparse
-                    parsed = urlparse(url)
+                    parsed = urlsplit(url)
                     host = parsed.netloc or parsed.path.split("/")[0] if parsed.path else ""
                     title = host.replace("www.", "") if host else "Source"
                 except:
@@ -635,13 +793,13 @@ def _transform_research_to_meeting_fields(research_result: Dict[str, Any]) -> Di
     # V1: Generate simple questions from key_points (no LLM)
     for kp in key_points[:6]:
         if isinstance(kp, str) and kp.strip():
-            # Convert statement to question if possible
-            kp_lower = kp.lower()
-            if "recent" in kp_lower or "announced" in kp_lower:
+            # Convert statement to question if possible (one classifier pass; news > funding > deal precedence)
+            kp_kinds = {m.lastgroup for m in _KEY_POINT_CLASSIFIER_RE.finditer(kp)}
+            if "news" in kp_kinds:
                 high_leverage_questions.append(f"What are the implications of {kp.strip()[:80]}?")
-            elif "raised" in kp_lower or "funding" in kp_lower:
+            elif "funding" in kp_kinds:
                 high_leverage_questions.append(f"How will this funding impact their strategy?")
-            elif "partnership" in kp_lower or "acquisition" in kp_lower:
+            elif "deal" in kp_kinds:
                 high_leverage_questions.append(f"What does this mean for their market position?")
             elif len(kp.strip()) > 20:
                 # Generic: "What should we know about [first 40 chars]?"
@@ -659,26 +817,69 @@ def _transform_research_to_meeting_fields(research_result: Dict[str, Any]) -> Di
     }
 
 
+_TIME_RE = re.compile(r"T(\d{2}):(\d{2})")
+
+
+@lru_cache(maxsize=1024)
 def _format_time_for_display(iso_time: str) -> str:
-    """Format ISO time string for display in digest."""
-    try:
-        # Extract time part (HH:MM)
-        time_part = iso_time.split("T")[1].split("-")[0][:5]
-        hour, minute = time_part.split(":")
-        hour_int = int(hour)
-
-        # Convert to 12-hour format
-        if hour_int == 0:
-            return f"12:{minute} AM ET"
-        elif hour_int < 12:
-            return f"{hour_int}:{minute} AM ET"
-        elif hour_int == 12:
-            return f"12:{minute} PM ET"
-        else:
-            return f"{hour_int - 12}:{minute} PM ET"
-    except (ValueError, IndexError):
+    """Format ISO time string for display in digest (cached; a day's events share few start times)."""
+    # Extract time part (HH:MM) in one scan
+    m = _TIME_RE.search(iso_time)
+    if not m:
         # Fallback to original time if parsing fails
         return iso_time
+    hour_int = int(m.group(1))
+    minute = m.group(2)
+
+    # Convert to 12-hour format
+    if hour_int == 0:
+        return f"12:{minute} AM ET"
+    elif hour_int < 12:
+        return f"{hour_int}:{minute} AM ET"
+    elif hour_int == 12:
+        return f"12:{minute} PM ET"
+    else:
+        return f"{hour_int - 12}:{minute} PM ET"
+
+
+@lru_cache(maxsize=32)
+def _build_alias_lookup(aliases_frozen: Tuple[Tuple[str, Tuple[str, ...]], ...]) -> Dict[str, str]:
+    """
+    Build the reverse lookup alias -> display canonical name.
+
+    Keyed on a hashable snapshot of the profile's aliases so the map is built
+    once per distinct alias config rather than on every call. Order is kept so
+    a later canonical still wins when two share an alias.
+    """
+    alias_to_canonical: Dict[str, str] = {}
+    for canonical, alias_list in aliases_frozen:
+        canonical_display = canonical.lower().title()
+        for alias in alias_list:
+            alias_to_canonical[alias.lower()] = canonical_display
+    return alias_to_canonical
+
+
+def _alias_lookup_for(aliases: Dict[str, List[str]]) -> Dict[str, str]:
+    """Reverse lookup alias -> canonical name for a profile's alias config (cached per config)."""
+    return _build_alias_lookup(
+        tuple((canonical, tuple(alias_list)) for canonical, alias_list in aliases.items())
+    )
+
+
+def _apply_aliases_to_meeting(meeting: dict, alias_to_canonical: Dict[str, str]) -> None:
+    """Canonicalize company names on one meeting dict (company field and attendees) in place."""
+    # Check company field
+    if meeting.get("company") and isinstance(meeting["company"], dict):
+        canonical = alias_to_canonical.get(meeting["company"].get("name", "").lower())
+        if canonical:
+            meeting["company"]["name"] = canonical
+
+    # Check attendees for company names
+    for attendee in meeting.get("attendees", []):
+        if attendee.get("company"):
+            canonical = alias_to_canonical.get(attendee["company"].lower())
+            if canonical:
+                attendee["company"] = canonical
 
 
 def _apply_company_aliases(meetings: list[dict], aliases: Dict[str, List[str]]) -> list[dict]:
@@ -686,54 +887,69 @@ def _apply_company_aliases(meetings: list[dict], aliases: Dict[str, List[str]])
     if not aliases:
         return meetings
 
-    # Create reverse lookup: alias -> canonical name
-    alias_to_canonical = {}
-    for canonical, alias_list in aliases.items():
-        for alias in alias_list:
-            alias_to_canonical[alias.lower()] = canonical.lower()
-
+    alias_to_canonical = _alias_lookup_for(aliases)
     for meeting in meetings:
-        # Check company field
-        if meeting.get("company") and isinstance(meeting["company"], dict):
-            company_name = meeting["company"].get("name", "").lower()
-            if company_name in alias_to_canonical:
-                meeting["company"]["name"] = alias_to_canonical[company_name].title()
-
-        # Check attendees for company names
-        for attendee in meeting.get("attendees", []):
-            if attendee.get("company"):
-                company_name = attendee["company"].lower()
-                if company_name in alias_to_canonical:
-                    attendee["company"] = alias_to_canonical[company_name].title()
+        _apply_aliases_to_meeting(meeting, alias_to_canonical)
 
     return meetings
 
 
+def _trim_meeting(meeting: Any, limits: Tuple[Tuple[str, int], ...]) -> None:
+    """Slice one meeting's list sections to their (section, max_count) limits in place."""
+    # Handle both dict and Pydantic model
+    if isinstance(meeting, dict):
+        for section, max_count in limits:
+            val = meeting.get(section)
+            if isinstance(val, list) and len(val) > max_count:
+                meeting[section] = val[:max_count]
+    else:
+        # Pydantic model - slice list fields in place; no model_dump round-trip,
+        # and untouched sections skip the assignment entirely
+        for section, max_count in limits:
+            val = getattr(meeting, section, None)
+            if isinstance(val, list) and len(val) > max_count:
+                setattr(meeting, section, val[:max_count])
+
+
 def _trim_meeting_sections(meetings: list, max_items: Dict[str, int]) -> list:
     """Trim meeting sections to respect max_items limits."""
+    if not max_items:
+        return meetings
+    limits = tuple(max_items.items())
     for meeting in meetings:
-        # Handle both dict and Pydantic model
-        if hasattr(meeting, 'model_dump'):
-            # Pydantic model - convert to dict, trim, then back to model
-            meeting_dict = meeting.model_dump()
-            for section, max_count in max_items.items():
-                if section in meeting_dict and isinstance(meeting_dict[section], list):
-                    meeting_dict[section] = meeting_dict[section][:max_count]
-
-            # Update the model with trimmed data
-            for section, max_count in max_items.items():
-                if section in meeting_dict and isinstance(meeting_dict[section], list):
-                    setattr(meeting, section, meeting_dict[section])
-        else:
-            # Regular dict
-            for section, max_count in max_items.items():
-                if section in meeting and isinstance(meeting[section], list):
-                    meeting[section] = meeting[section][:max_count]
+        _trim_meeting(meeting, limits)
 
     return meetings
 
 
-def _convert_raw_graph_to_events(raw_graph_events: List[dict]) -> List[Event]:
+def _pipeline_meeting(
+    meeting: Dict[str, Any], aliases: Dict[str, List[str]], max_items: Dict[str, int]
+) -> Union[Dict[str, Any], BaseModel]:
+    """
+    Single-meeting pipeline: aliases -> enrichment -> max_items trim -> memory.
+
+    Same stages as the digest path, applied directly to one meeting without
+    building an intermediate list per stage.
+    """
+    if aliases:
+        _apply_aliases_to_meeting(meeting, _alias_lookup_for(aliases))
+    enriched = enrich_meetings([meeting])[0]
+    if max_items:
+        _trim_meeting(enriched, tuple(max_items.items()))
+    return attach_memory_to_meeting(enriched)
+
+
+# Shared read-only default for missing Graph sub-objects (avoids a fresh {} per lookup)
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+
+def _graph_email_name_address(obj: Mapping[str, Any]) -> Tuple[str, str]:
+    """(name, address) from a Graph attendee/organizer {"emailAddress": {...}} shape."""
+    email_address = obj.get("emailAddress") or _EMPTY_MAPPING
+    return email_address.get("name", ""), email_address.get("address", "")
+
+
+def _convert_raw_graph_to_events(raw_graph_events: List[dict]) -> Iterator[Event]:
     """
     Convert raw Microsoft Graph API event shapes to Event objects.
     
@@ -743,12 +959,19 @@ def _convert_raw_graph_to_events(raw_graph_events: List[dict]) -> List[Event]:
     Args:
         raw_graph_events: List of raw Graph API event dicts
         
-    Returns:
-        List of Event objects
+    Yields:
+        Event objects, lazily, so the caller can map them in the same pass
     """
     et_tz = ZoneInfo("America/New_York")
-    events = []
-    
+    # Most Graph events share a handful of zone names (usually ET); resolve each once per batch
+    tz_cache: Dict[str, ZoneInfo] = {"America/New_York": et_tz}
+
+    def _tz(name: str) -> ZoneInfo:
+        tz = tz_cache.get(name)
+        if tz is None:
+            tz = tz_cache[name] = ZoneInfo(name)
+        return tz
+
     for item in raw_graph_events:
         # Skip cancelled events (same as adapter)
         if item.get("isCancelled", False):
@@ -756,11 +979,11 @@ def _convert_raw_graph_to_events(raw_graph_events: List[dict]) -> List[Event]:
         
         try:
             # Parse start/end times (same logic as adapter)
-            start_obj = item.get("start", {})
+            start_obj = item.get("start") or _EMPTY_MAPPING
             start_dt_str = start_obj.get("dateTime", "")
             start_tz_str = start_obj.get("timeZone", "America/New_York")
             
-            end_obj = item.get("end", {})
+            end_obj = item.get("end") or _EMPTY_MAPPING
             end_dt_str = end_obj.get("dateTime", "")
             end_tz_str = end_obj.get("timeZone", "America/New_York")
             
@@ -773,20 +996,19 @@ def _convert_raw_graph_to_events(raw_graph_events: List[dict]) -> List[Event]:
             
             # Apply timezone if naive
             if start_dt.tzinfo is None:
-                start_dt = start_dt.replace(tzinfo=ZoneInfo(start_tz_str))
+                start_dt = start_dt.replace(tzinfo=_tz(start_tz_str))
             if end_dt.tzinfo is None:
-                end_dt = end_dt.replace(tzinfo=ZoneInfo(end_tz_str))
+                end_dt = end_dt.replace(tzinfo=_tz(end_tz_str))
             
-            # Convert to ET
-            start_dt_et = start_dt.astimezone(et_tz)
-            end_dt_et = end_dt.astimezone(et_tz)
+            # Convert to ET (already-ET values, the common case, need no conversion)
+            start_dt_et = start_dt if start_dt.tzinfo is et_tz else start_dt.astimezone(et_tz)
+            end_dt_et = end_dt if end_dt.tzinfo is et_tz else end_dt.astimezone(et_tz)
             
-            # Normalize attendees (same logic as adapter)
-            attendees = []
+            # Normalize attendees (same logic as adapter). Kept as plain dicts: Event.model_validate below
+            # validates them into Attendee models in one pass instead of one constructor per attendee
+            attendees: List[Dict[str, Any]] = []
             for attendee in item.get("attendees", []):
-                email_address = attendee.get("emailAddress", {})
-                name = email_address.get("name", "")
-                email = email_address.get("address", "")
+                name, email = _graph_email_name_address(attendee)
                 
                 # Extract company from email domain
                 company = None
@@ -795,36 +1017,25 @@ def _convert_raw_graph_to_events(raw_graph_events: List[dict]) -> List[Event]:
                     if domain and domain != "rpck.com":
                         company = domain.split(".")[0].title()
                 
-                attendees.append(Attendee(
-                    name=name or email,
-                    email=email,
-                    company=company
-                ))
+                attendees.append({"name": name or email, "email": email, "company": company})
             
             # Add organizer to attendees if not already there
-            organizer = item.get("organizer", {}).get("emailAddress", {})
-            organizer_email = organizer.get("address", "")
-            organizer_name = organizer.get("name", "")
+            organizer_name, organizer_email = _graph_email_name_address(item.get("organizer") or _EMPTY_MAPPING)
             
             if organizer_email:
-                organizer_in_attendees = any(
-                    (a.email or "").lower() == organizer_email.lower()
-                    for a in attendees
-                )
-                if not organizer_in_attendees:
+                attendee_emails_lower = {(a["email"] or "").lower() for a in attendees}
+                if organizer_email.lower() not in attendee_emails_lower:
                     company = None
                     if "@" in organizer_email:
                         domain = organizer_email.split("@")[1]
                         if domain and domain != "rpck.com":
                             company = domain.split(".")[0].title()
-                    attendees.append(Attendee(
-                        name=organizer_name or organizer_email,
-                        email=organizer_email,
-                        company=company
-                    ))
+                    attendees.append(
+                        {"name": organizer_name or organizer_email, "email": organizer_email, "company": company}
+                    )
             
             # Extract location
-            location = item.get("location", {}).get("displayName")
+            location = (item.get("location") or _EMPTY_MAPPING).get("displayName")
             
             # Extract notes
             notes = item.get("bodyPreview", "")
@@ -832,18 +1043,16 @@ def _convert_raw_graph_to_events(raw_graph_events: List[dict]) -> List[Event]:
                 notes = notes.strip()[:500]
             
             # Create Event object
-            event = Event(
-                subject=item.get("subject", ""),
-                start_time=start_dt_et.isoformat(),
-                end_time=end_dt_et.isoformat(),
-                location=location,
-                attendees=attendees,
-                notes=notes,
-                id=item.get("id"),
-                organizer=organizer_email
-            )
-            
-            events.append(event)
+            event = Event.model_validate({
+                "subject": item.get("subject", ""),
+                "start_time": start_dt_et.isoformat(),
+                "end_time": end_dt_et.isoformat(),
+                "location": location,
+                "attendees": attendees,
+                "notes": notes,
+                "id": item.get("id"),
+                "organizer": organizer_email,
+            })
             
         except Exception as e:
             # Skip events that fail to parse (same as adapter)
@@ -851,26 +1060,118 @@ def _convert_raw_graph_to_events(raw_graph_events: List[dict]) -> List[Event]:
             logger = logging.getLogger(__name__)
             logger.warning(f"Failed to parse stub event: {e}")
             continue
-    
-    return events
 
+        yield event
+
+
+def _dict_identity(x: Dict[str, Any]) -> Dict[str, Any]:
+    return x
+
+
+def _dict_from_model_dump(x: Any) -> Dict[str, Any]:
+    return x.model_dump()
+
+
+def _dict_from_legacy_dict(x: Any) -> Dict[str, Any]:
+    return x.dict()
+
+
+def _dict_empty(x: Any) -> Dict[str, Any]:
+    return {}
+
+
+# type -> converter chosen by _to_dict; a digest's meetings/attendees share one or two types
+_TO_DICT_DISPATCH: Dict[type, Callable[[Any], Dict[str, Any]]] = {dict: _dict_identity}
+
+
+def _to_dict(x: Any) -> Dict[str, Any]:
+    """
+    Normalize a meeting/attendee to a dict: dicts as-is, Pydantic models via model_dump(),
+    v1-style models via dict(), anything else {}. The capability probe runs once per type.
+    """
+    fn = _TO_DICT_DISPATCH.get(type(x))
+    if fn is None:
+        if isinstance(x, dict):
+            fn = _dict_identity
+        elif hasattr(x, "model_dump"):
+            fn = _dict_from_model_dump
+        elif hasattr(x, "dict"):
+            fn = _dict_from_legacy_dict
+        else:
+            fn = _dict_empty
+        _TO_DICT_DISPATCH[type(x)] = fn
+    return fn(x)
+
+
+def _meeting_field_setter(meeting: Any) -> Callable[[str, Any], None]:
+    """Setter for a key on a meeting dict, or on a model's __dict__ (bypassing validation); no-op otherwise."""
+    if isinstance(meeting, dict):
+        return meeting.__setitem__
+    meeting_vars = getattr(meeting, "__dict__", None)
+    if meeting_vars is not None:
+        return meeting_vars.__setitem__
+    return lambda key, value: None
 
-def _map_events_to_meetings(events: list[dict] | list) -> list[dict]:
+
+def _meeting_fields_updater(meeting: Any) -> Callable[[Mapping[str, Any]], None]:
+    """
+    Bulk update for a meeting dict, or for a model's __dict__ (no model_dump round-trip).
+
+    For Pydantic models the keys are also added to __pydantic_fields_set__ so
+    exclude_unset serialization still includes them; no-op for other objects.
+    """
+    if isinstance(meeting, dict):
+        return meeting.update
+    meeting_vars = getattr(meeting, "__dict__", None)
+    if meeting_vars is None:
+        return lambda fields: None
+    fields_set = getattr(meeting, "__pydantic_fields_set__", None)
+    if not isinstance(fields_set, set):
+        return meeting_vars.update
+
+    def _update(fields: Mapping[str, Any]) -> None:
+        meeting_vars.update(fields)
+        fields_set.update(fields)
+
+    return _update
+
+
+def _fast_event_dict(e: Any) -> Dict[str, Any]:
+    """
+    Flat field dict for an event without a recursive model_dump().
+
+    For real Event models the instance __dict__ already holds every field; nested
+    attendees stay as Attendee models and are read by _map_events_to_meetings.
+    Anything else (plain dicts, other dumpable objects) goes through the usual path.
+    """
+    if isinstance(e, Event):
+        return e.__dict__
+    if isinstance(e, dict):
+        return e
+    return e.model_dump()
+
+
+def _map_events_to_meetings(events: Iterable[Any]) -> list[dict]:
     meetings: list[dict] = []
     for e in events:
-        # e is a pydantic model dict-like; support both dict and model
-        subject = getattr(e, "subject", None) or e.get("subject", "")
-        start_time = getattr(e, "start_time", None) or e.get("start_time", "")
-        location = getattr(e, "location", None) or e.get("location")
-        organizer = getattr(e, "organizer", None) or e.get("organizer")
-        attendees_raw = getattr(e, "attendees", None) or e.get("attendees", [])
-        attendees = []
-        for a in attendees_raw:
-            name = getattr(a, "name", None) or a.get("name", "")
-            title = getattr(a, "title", None) or a.get("title")
-            company = getattr(a, "company", None) or a.get("company")
-            email = getattr(a, "email", None) or a.get("email")
-            attendees.append({"name": name, "title": title, "company": company, "email": email})
+        # e is a pydantic model dict-like; support both dict and model (model fields read from __dict__)
+        fields = e if isinstance(e, dict) else e.__dict__
+        subject = fields.get("subject") or ""
+        start_time = fields.get("start_time") or ""
+        location = fields.get("location")
+        organizer = fields.get("organizer")
+        attendees_raw = fields.get("attendees") or []
+        # Branch once per event on attendee shape: Attendee models (read via __dict__) or dicts
+        if attendees_raw and not isinstance(attendees_raw[0], dict):
+            attendees = [
+                {"name": ad.get("name") or "", "title": ad.get("title"), "company": ad.get("company"), "email": ad.get("email")}
+                for ad in (a.__dict__ for a in attendees_raw)
+            ]
+        else:
+            attendees = [
+                {"name": a.get("name", ""), "title": a.get("title"), "company": a.get("company"), "email": a.get("email")}
+                for a in attendees_raw
+            ]
 
         meetings.append(
             {
@@ -893,6 +1194,151 @@ def _map_events_to_meetings(events: list[dict] | list) -> list[dict]:
     return meetings
 
 
+# Enum values used on every research-loop skip path, resolved once at import
+_OUTCOME_SKIPPED = ResearchOutcome.SKIPPED.value
+_SKIP_NO_ANCHOR = SkipReason.NO_ANCHOR.value
+_SKIP_LOW_CONFIDENCE_ANCHOR = SkipReason.LOW_CONFIDENCE_ANCHOR.value
+_SKIP_BUDGET_EXHAUSTED = SkipReason.BUDGET_EXHAUSTED.value
+_SKIP_OFF_TARGET_RESULTS = SkipReason.OFF_TARGET_RESULTS.value
+
+# Timings for skip traces where nothing ran (build_research_trace copies it)
+_ZERO_TIMINGS: Dict[str, int] = {"selection_ms": 0, "tavily_ms": 0, "summarize_ms": 0}
+# Read-only template for the test-meeting skip trace (no per-meeting fields); copied per attach
+_TRACE_MEETING_MARKED_TEST: Mapping[str, Any] = MappingProxyType(build_research_trace(
+    attempted=True,
+    outcome=_OUTCOME_SKIPPED,
+    skip_reason=SkipReason.MEETING_MARKED_TEST.value,
+    timings_ms=_ZERO_TIMINGS,
+))
+
+# Legal-form tokens that don't change which organization a quoted org phrase names
+_ORG_SUFFIX_TOKENS = frozenset({
+    "inc", "incorporated", "corp", "corporation", "co", "company", "llc", "llp", "lp",
+    "ltd", "limited", "plc", "gmbh", "ag", "sa", "bv", "pte",
+})
+# A quoted phrase (group 1) or a run of unquoted text (group 2)
+_QUERY_SEGMENT_RE = re.compile(r'"([^"]*)"|([^"]+)')
+
+
+@lru_cache(maxsize=2048)
+def _research_cache_key(query: str) -> str:
+    """
+    Cache key under which near-duplicate research queries share a result: case and
+    whitespace are ignored, and a legal-form suffix is dropped only when it ends a
+    quoted phrase after a name, so '"Acme Inc" CEO' and '"Acme Incorporated" ceo'
+    share an entry while '"AG Capital"' and '"Capital"' do not. Punctuation, search
+    operators ('-site:', '+term') and phrase boundaries are kept, since they change
+    what the search matches.
+    """
+    parts: List[str] = []
+    for m in _QUERY_SEGMENT_RE.finditer(query.lower()):
+        phrase, bare = m.groups()
+        if phrase is None:
+            parts.extend(bare.split())
+            continue
+        tokens = phrase.split()
+        if len(tokens) > 1 and tokens[-1].rstrip(".") in _ORG_SUFFIX_TOKENS:
+            while len(tokens) > 1 and tokens[-1].rstrip(".") in _ORG_SUFFIX_TOKENS:
+                tokens.pop()
+            # "Acme, Inc." -> "acme": the separator belonged to the dropped suffix
+            tokens[-1] = tokens[-1].rstrip(",")
+        parts.append('"' + " ".join(tokens) + '"')
+    # Never let a whitespace-only query collapse onto the empty key
+    return " ".join(parts) or query.strip().lower()
+
+
+# Query templates for ambiguous-acronym primary calls and guardrail retries
+_Q_PERSON_ORG = '"{anchor}" "{org}"'
+_Q_ORG = '"{org}"'
+_Q_RETRY_AMBIGUOUS_PERSON = '"{anchor}" "{org}" (site:linkedin.com OR site:theorg.com)'
+_Q_RETRY_AMBIGUOUS_ORG = '"{org}" (site:linkedin.com OR site:theorg.com)'
+_Q_RETRY_SITE_PERSON = '"{anchor}" "{org}" site:{domain}'
+_Q_RETRY_SITE_ORG = '"{org}" site:{domain}'
+
+
+@lru_cache(maxsize=2048)
+def _build_ambiguous_primary_query(anchor: str, org: str, is_person: bool) -> str:
+    """Primary query for ambiguous acronym domains: person+org (or org only), no site: filter."""
+    if is_person and anchor:
+        return _Q_PERSON_ORG.format(anchor=anchor, org=org)
+    return _Q_ORG.format(org=org)
+
+
+@lru_cache(maxsize=2048)
+def _build_retry_query(anchor: str, org: str, domain: str, is_person: bool, ambiguous: bool) -> str:
+    """Stricter retry query: LinkedIn/TheOrg for ambiguous acronyms, else site:expected_domain."""
+    if ambiguous:
+        template = _Q_RETRY_AMBIGUOUS_PERSON if is_person and anchor else _Q_RETRY_AMBIGUOUS_ORG
+    else:
+        template = _Q_RETRY_SITE_PERSON if is_person and anchor else _Q_RETRY_SITE_ORG
+    return template.format(anchor=anchor, org=org, domain=domain)
+
+
+# Research candidate scoring: keyword lists matched against the lowercased subject
+_RESEARCH_SKIP_SUBJECT_PATTERNS = ("blocked time", "recap voice note", "complete forms", "admin", "internal hold")
+_RESEARCH_HIGH_VALUE_KEYWORDS = (
+    "intro", "introductory", "kickoff", "diligence", "closing",
+    "negotiation", "term sheet", "board", "investor", "financing",
+    "acquisition", "dispute", "arbitration",
+)
+_RESEARCH_NEGATIVE_KEYWORDS = ("internal", "admin", "recap", "blocked", "hold")
+_RESEARCH_WITH_PHRASES = ("call with", "meeting with")
+
+
+def _keyword_class(name: str, keywords: Tuple[str, ...]) -> str:
+    return f"(?P<{name}>" + "|".join(map(re.escape, keywords)) + ")"
+
+
+# All keyword classes in one scan. The lookahead makes matches zero-width, so keywords from
+# different classes that overlap in the subject are all reported (same as separate `in` checks).
+_RESEARCH_SUBJECT_CLASS_RE = re.compile(
+    "(?=" + "|".join((
+        _keyword_class("skip", _RESEARCH_SKIP_SUBJECT_PATTERNS),
+        _keyword_class("high_value", _RESEARCH_HIGH_VALUE_KEYWORDS),
+        _keyword_class("negative", _RESEARCH_NEGATIVE_KEYWORDS),
+        _keyword_class("with_phrase", _RESEARCH_WITH_PHRASES),
+    )) + ")"
+)
+
+
+def _research_score_tail(
+    *,
+    has_external_org: bool,
+    external_attendee_count: int,
+    high_value: bool,
+    with_phrase: bool,
+    negative: bool,
+    attendee_count: int,
+) -> int:
+    """Numeric part of research candidate scoring; all string work happens in the caller."""
+    score = 0
+    # External organizer boost
+    if has_external_org:
+        score += 30
+    # External attendee boost (cap at +45 for 3+ external attendees)
+    score += min(external_attendee_count * 15, 45)
+    # Subject keyword boosts
+    if high_value:
+        score += 20
+    if with_phrase:
+        score += 10
+    if negative:
+        score -= 15
+    # Attendee count shaping
+    if 1 <= attendee_count <= 3 and (has_external_org or external_attendee_count > 0):
+        score += 10
+    if attendee_count >= 8:
+        score -= 5
+    return score
+
+
+# Counterparty from subject: "Call with X" / "Intro: X"
+_COUNTERPARTY_WITH_RE = re.compile(
+    r"^(?:call|meeting|intro|catch[- ]?up|1:1|one[- ]?on[- ]?one)\s+with\s+(.+)$", re.IGNORECASE
+)
+_COUNTERPARTY_INTRO_RE = re.compile(r"^intro\s*[:\-]\s*(.+)$", re.IGNORECASE)
+
+
 def build_digest_context_with_provider(
     source: Literal["sample", "live", "stub"],
     date: Optional[str] = None,
@@ -937,7 +1383,7 @@ def build_digest_context_with_provider(
             events = provider.fetch_events(requested_date, user=user_mailbox)
             logger.info(f"Received {len(events)} events from provider {provider_name} for {requested_date}, mailbox={user_mailbox}")
             if events:
-                meetings = _map_events_to_meetings([e.model_dump() for e in events])
+                meetings = _map_events_to_meetings([_fast_event_dict(e) for e in events])
                 actual_source = "live"
                 logger.info(f"Mapped to {len(meetings)} meetings")
             else:
@@ -965,18 +1411,15 @@ def build_digest_context_with_provider(
         # This ensures stub mode exercises the same transformation as live mode
         logger.info(f"Using stub mode with {len(STUB_MEETINGS_RAW_GRAPH)} raw Graph events")
         
-        # Convert raw Graph shapes to Event objects (same as adapter does)
-        stub_events = _convert_raw_graph_to_events(STUB_MEETINGS_RAW_GRAPH)
-        logger.info(f"Converted to {len(stub_events)} Event objects")
-        
-        # Pass through same mapping as live mode
-        if stub_events:
-            meetings = _map_events_to_meetings([e.model_dump() for e in stub_events])
-            actual_source = "stub"
-            logger.info(f"Mapped to {len(meetings)} meetings")
+        # Convert raw Graph shapes to Event objects (same as adapter does) and pass them
+        # through the same mapping as live mode in one pass (no intermediate Event list)
+        meetings = _map_events_to_meetings(
+            _fast_event_dict(e) for e in _convert_raw_graph_to_events(STUB_MEETINGS_RAW_GRAPH)
+        )
+        actual_source = "stub"
+        if meetings:
+            logger.info(f"Converted and mapped {len(meetings)} stub events to meetings")
         else:
-            meetings = []
-            actual_source = "stub"
             logger.info("No valid stub events after conversion")
     else:
         # Sample mode - use sample data
@@ -996,9 +1439,9 @@ def build_digest_context_with_provider(
     meetings_with_memory = attach_memory_to_meetings(meetings_trimmed)
 
     # Format date_human based on requested date (or today if not specified)
-    tz_name = _get_timezone()
+    tz = _get_timezone()
     if requested_date:
-        date_human = _format_date_et_str(requested_date, tz_name)
+        date_human = _format_date_et_str(requested_date, tz)
         # Extract year from requested date for current_year
         try:
             date_obj = datetime.strptime(requested_date, "%Y-%m-%d")
@@ -1006,7 +1449,7 @@ def build_digest_context_with_provider(
         except ValueError:
             current_year = datetime.now().strftime("%Y")
     else:
-        date_human = _today_et_str(tz_name)
+        date_human = _today_et_str(tz)
         current_year = datetime.now().strftime("%Y")
 
     # Add dev flags for template gating
@@ -1040,8 +1483,7 @@ def build_digest_context_with_provider(
     budget = research_budget if research_budget is not None else ResearchBudget(MAX_TAVILY_CALLS_PER_REQUEST)
     context["_research_computed"] = False  # set True after we set context["research"]
 
-    from app.research.selector import should_run_research, select_research_provider
-    allowed, skip_reason = should_run_research()
+    allowed, skip_reason = research_selector.should_run_research()
     if not allowed:
         context["research"] = {"summary": "", "key_points": [], "sources": []}
         skip_reason_enum = SkipReason.DISABLED.value if skip_reason == "disabled" else SkipReason.DEV_GUARD.value
@@ -1057,153 +1499,139 @@ def build_digest_context_with_provider(
     selection_start = time.perf_counter()
     try:
 
+            # id(meeting) -> dict form; meetings outlive this block so ids are stable for the request
+            meeting_data_cache: Dict[int, Dict[str, Any]] = {}
+
             def _meeting_to_data(m: Any) -> Dict[str, Any]:
-                """Normalize meeting to dict (handle Pydantic models)."""
-                if hasattr(m, "model_dump"):
-                    return m.model_dump()
-                if hasattr(m, "dict"):
-                    return m.dict()
-                if isinstance(m, dict):
+                """Normalize meeting to dict (handle Pydantic models); dumped once per meeting."""
+                if type(m) is dict:
                     return m
-                return {}
+                cached = meeting_data_cache.get(id(m))
+                if cached is not None:
+                    return cached
+                data = _to_dict(m)
+                meeting_data_cache[id(m)] = data
+                return data
 
             def _domain_from_email(email: Any) -> str:
                 """Extract domain from email string; empty if not present."""
                 if not email:
                     return ""
-                s = (email if isinstance(email, str) else str(email)).strip().lower()
-                if "@" in s:
-                    return s.split("@", 1)[1]
-                return ""
+                s = email if isinstance(email, str) else str(email)
+                at = s.find("@")
+                if at < 0:
+                    return ""
+                # Slice after the first "@" (no split list); only the domain part gets stripped/lowered
+                return s[at + 1:].strip().lower()
+
+            _normalize_attendee = _to_dict
 
-            def _normalize_attendee(a: Any) -> Dict[str, Any]:
-                """Normalize attendee to dict."""
-                if isinstance(a, dict):
-                    return a
-                if hasattr(a, "model_dump"):
-                    return a.model_dump()
-                if hasattr(a, "dict"):
-                    return a.dict()
-                return {}
-
-            def score_meeting_for_research(meeting_data: Dict[str, Any]) -> int:
-                """Score meeting for research priority. Higher score = better candidate."""
+            def _attendee_domain(ad: Any) -> str:
+                """Email domain of a normalized attendee dict; empty if none."""
+                if not isinstance(ad, dict):
+                    return ""
+                return _domain_from_email(ad.get("email") or ad.get("address"))
+
+            def score_meeting_for_research(
+                meeting_data: Dict[str, Any], attendee_domains: Optional[List[str]] = None
+            ) -> int:
+                """
+                Score meeting for research priority. Higher score = better candidate.
+                attendee_domains: per-attendee email domains, when the caller has already computed them.
+                """
                 subject = (meeting_data.get("subject") or meeting_data.get("title") or "").strip().lower()
                 
+                subject_classes = {m.lastgroup for m in _RESEARCH_SUBJECT_CLASS_RE.finditer(subject)}
+                
                 # Skip internal/admin subjects
-                skip_patterns = ["blocked time", "recap voice note", "complete forms", "admin", "internal hold"]
-                if any(pattern in subject for pattern in skip_patterns):
+                if "skip" in subject_classes:
                     return -9999
                 
-                score = 0
-                
-                # External organizer boost
-                org = meeting_data.get("organizer")
-                org_domain = _domain_from_email(org)
-                has_external_org = org_domain and org_domain != "rpck.com"
-                if has_external_org:
-                    score += 30
-                
-                # External attendee boost (cap at +45 for 3+ external attendees)
-                external_attendee_count = 0
-                for a in meeting_data.get("attendees") or []:
-                    ad = _normalize_attendee(a)
-                    if not isinstance(ad, dict):
-                        continue
-                    email = ad.get("email") or ad.get("address")
-                    dom = _domain_from_email(email)
-                    if dom and dom != "rpck.com":
-                        external_attendee_count += 1
-                score += min(external_attendee_count * 15, 45)
-                
-                # Subject keyword boosts
-                high_value_keywords = [
-                    "intro", "introductory", "kickoff", "diligence", "closing",
-                    "negotiation", "term sheet", "board", "investor", "financing",
-                    "acquisition", "dispute", "arbitration"
-                ]
-                if any(kw in subject for kw in high_value_keywords):
-                    score += 20
-                
-                if "call with" in subject or "meeting with" in subject:
-                    score += 10
-                
-                negative_keywords = ["internal", "admin", "recap", "blocked", "hold"]
-                if any(kw in subject for kw in negative_keywords):
-                    score -= 15
-                
-                # Attendee count shaping
-                attendee_count = len(meeting_data.get("attendees") or [])
-                has_external = has_external_org or external_attendee_count > 0
-                if 1 <= attendee_count <= 3 and has_external:
-                    score += 10
-                if attendee_count >= 8:
-                    score -= 5
-                
-                return score
+                org_domain = _domain_from_email(meeting_data.get("organizer"))
+                if attendee_domains is None:
+                    attendee_domains = [
+                        _attendee_domain(_normalize_attendee(a)) for a in meeting_data.get("attendees") or []
+                    ]
+                return _research_score_tail(
+                    has_external_org=bool(org_domain) and org_domain != "rpck.com",
+                    external_attendee_count=sum(1 for dom in attendee_domains if dom and dom != "rpck.com"),
+                    high_value="high_value" in subject_classes,
+                    with_phrase="with_phrase" in subject_classes,
+                    negative="negative" in subject_classes,
+                    attendee_count=len(meeting_data.get("attendees") or []),
+                )
 
             def extract_counterparty_from_subject(subj: str) -> str:
                 """Extract counterparty name from subject patterns like 'Call with X', 'Intro: X'."""
                 if not subj or not subj.strip():
                     return ""
                 subj = subj.strip()
-                m = re.search(
-                    r"^(?:call|meeting|intro|catch[- ]?up|1:1|one[- ]?on[- ]?one)\s+with\s+(.+)$",
-                    subj,
-                    re.IGNORECASE,
-                )
+                m = _COUNTERPARTY_WITH_RE.search(subj)
                 if m:
                     name = m.group(1).strip().rstrip(".,;:—-")
                     return name if name else ""
-                m = re.search(r"^intro\s*[:\-]\s*(.+)$", subj, re.IGNORECASE)
+                m = _COUNTERPARTY_INTRO_RE.search(subj)
                 if m:
                     name = m.group(1).strip().rstrip(".,;:—-")
                     return name if name else ""
                 return ""
 
-            from app.research.anchor_utils import extract_org_from_subject, org_from_email_domain
-
             # Per-meeting research enrichment (V1: meeting-scoped research)
             # Hard cap: max 8 Tavily calls per digest request (budget); strict cap: at most 1 provider call per digest
             MAX_CALLS_PER_DIGEST = 8
             MAX_RESEARCH_CALLS_PER_DIGEST = 1
             research_calls_used = 0
-            provider = select_research_provider()
+            provider = research_selector.select_research_provider()
             exec_name = (context.get("exec_name") or "").strip()
             exec_mailbox = (user_mailbox or "").strip() if user_mailbox else None
             
             # Dedupe cache: keyed by sanitized query, stores research_result
             research_cache: Dict[str, Dict[str, Any]] = {}
+            # Cross-request cache (process-wide TTL); provider-scoped so stub and live results never mix
+            shared_cache_ttl_s = get_research_cache_ttl_seconds()
+            shared_cache_prefix = f"{type(provider).__name__}:"
+            shared_cache_hits = 0
             calls_made = 0
             
             # Track research traces per meeting (for dev/debug, not rendered in prod)
             research_traces_by_meeting_id: Dict[str, Dict[str, Any]] = {}
+            set_trace_by_meeting_id = research_traces_by_meeting_id.__setitem__
             
-            # Process each meeting
+            # Pass 1: cheap filters (internal score, test meetings) over every meeting;
+            # only survivors go on to anchor computation and provider work
+            eligible_count = 0
+            research_candidates = []
             for meeting_idx, meeting in enumerate(meetings_with_memory or []):
                 meeting_data = _meeting_to_data(meeting)
+                # Normalize attendees once; reused by scoring and the skip-reason path below
+                meeting_attendees = [_normalize_attendee(a) for a in meeting_data.get("attendees") or []]
+                attendee_domains = [_attendee_domain(ad) for ad in meeting_attendees]
                 
                 # Skip internal meetings (score < 0)
-                score = score_meeting_for_research(meeting_data)
-                if score < 0:
+                if score_meeting_for_research(meeting_data, attendee_domains) < 0:
                     continue
+                eligible_count += 1
+                
+                # Resolve dict-vs-model once; used wherever a trace is attached
+                set_meeting_field = _meeting_field_setter(meeting)
                 
                 # Check for test meetings first (before computing anchor)
                 meeting_id = meeting_data.get("id") or f"meeting_{meeting_idx}"
                 if is_meeting_like_test(meeting_data, exec_mailbox):
-                    trace = build_research_trace(
-                        attempted=True,
-                        outcome=ResearchOutcome.SKIPPED.value,
-                        skip_reason=SkipReason.MEETING_MARKED_TEST.value,
-                        timings_ms={"selection_ms": 0, "tavily_ms": 0, "summarize_ms": 0},
-                    )
-                    research_traces_by_meeting_id[meeting_id] = trace
+                    trace = {**_TRACE_MEETING_MARKED_TEST, "timings_ms": dict(_ZERO_TIMINGS)}
+                    set_trace_by_meeting_id(meeting_id, trace)
                     # Attach trace to meeting for dev UI
-                    if isinstance(meeting, dict):
-                        meeting["research_trace"] = trace
-                    elif hasattr(meeting, "__dict__"):
-                        meeting.__dict__["research_trace"] = trace
+                    set_meeting_field("research_trace", trace)
                     continue
+                research_candidates.append(
+                    (meeting, meeting_data, meeting_attendees, attendee_domains, set_meeting_field, meeting_id)
+                )
+            
+            # Pass 2: anchor, budget and provider work for each surviving meeting
+            for (
+                meeting, meeting_data, meeting_attendees, attendee_domains, set_meeting_field, meeting_id
+            ) in research_candidates:
+                update_meeting_fields = _meeting_fields_updater(meeting)
                 
                 # Compute anchor and query
                 anchor_result = _compute_meeting_anchor_and_query(
@@ -1225,47 +1653,35 @@ def build_digest_context_with_provider(
                 
                 # anchor_result can be: success dict (chosen_query), failure dict (skip_reason), or None
                 if isinstance(anchor_result, dict) and anchor_result.get("skip_reason") and not anchor_result.get("chosen_query"):
-                    skip_reason = anchor_result.get("skip_reason", SkipReason.NO_ANCHOR.value)
+                    skip_reason = anchor_result.get("skip_reason", _SKIP_NO_ANCHOR)
                     trace = build_research_trace(
                         attempted=True,
-                        outcome=ResearchOutcome.SKIPPED.value,
+                        outcome=_OUTCOME_SKIPPED,
                         skip_reason=skip_reason,
                         primary_domain=anchor_result.get("primary_domain"),
-                        timings_ms={"selection_ms": 0, "tavily_ms": 0, "summarize_ms": 0},
+                        timings_ms=_ZERO_TIMINGS,
                     )
-                    research_traces_by_meeting_id[meeting_id] = trace
-                    if isinstance(meeting, dict):
-                        meeting["research_trace"] = trace
-                    elif hasattr(meeting, "__dict__"):
-                        meeting.__dict__["research_trace"] = trace
+                    set_trace_by_meeting_id(meeting_id, trace)
+                    set_meeting_field("research_trace", trace)
                     continue
 
                 if not anchor_result:
                     # No usable anchor/query - LOW_CONFIDENCE_ANCHOR when we had external domains, else NO_ANCHOR
-                    subject = (meeting_data.get("subject") or meeting_data.get("title") or "").strip()
-                    org = meeting_data.get("organizer")
-                    org_domain = _domain_from_email(org)
+                    org_domain = _domain_from_email(meeting_data.get("organizer"))
                     has_external_org = org_domain and org_domain != "rpck.com" and not is_consumer_domain(org_domain)
-                    external_attendees = []
-                    for a in meeting_data.get("attendees") or []:
-                        ad = _normalize_attendee(a)
-                        if isinstance(ad, dict):
-                            email = ad.get("email") or ad.get("address")
-                            dom = _domain_from_email(email)
-                            if dom and dom != "rpck.com" and not is_consumer_domain(dom):
-                                external_attendees.append({"name": ad.get("name"), "domain": dom})
-                    skip_reason = SkipReason.LOW_CONFIDENCE_ANCHOR.value if (has_external_org or external_attendees) else SkipReason.NO_ANCHOR.value
+                    # Only the presence of an external attendee matters here; stop at the first one
+                    has_external_attendee = has_external_org or any(
+                        dom and dom != "rpck.com" and not is_consumer_domain(dom) for dom in attendee_domains
+                    )
+                    skip_reason = _SKIP_LOW_CONFIDENCE_ANCHOR if has_external_attendee else _SKIP_NO_ANCHOR
                     trace = build_research_trace(
                         attempted=True,
-                        outcome=ResearchOutcome.SKIPPED.value,
+                        outcome=_OUTCOME_SKIPPED,
                         skip_reason=skip_reason,
-                        timings_ms={"selection_ms": 0, "tavily_ms": 0, "summarize_ms": 0},
+                        timings_ms=_ZERO_TIMINGS,
                     )
-                    research_traces_by_meeting_id[meeting_id] = trace
-                    if isinstance(meeting, dict):
-                        meeting["research_trace"] = trace
-                    elif hasattr(meeting, "__dict__"):
-                        meeting.__dict__["research_trace"] = trace
+                    set_trace_by_meeting_id(meeting_id, trace)
+                    set_meeting_field("research_trace", trace)
                     continue
 
                 chosen_query = anchor_result["chosen_query"]
@@ -1279,20 +1695,23 @@ def build_digest_context_with_provider(
                 ambiguous_acronym = _is_ambiguous_acronym_domain(expected_domain)
                 # For ambiguous acronym domains: primary query is person+org only (no site:) to avoid ticker noise
                 if ambiguous_acronym and org_display:
-                    query_for_call = (
-                        f'"{anchor_display}" "{org_display}"'
-                        if anchor_type_str == AnchorType.PERSON.value and anchor_display
-                        else f'"{org_display}"'
+                    query_for_call = _build_ambiguous_primary_query(
+                        anchor_display, org_display, anchor_type_str == AnchorType.PERSON.value
                     )
                 else:
                     query_for_call = chosen_query
 
                 # Check dedupe cache first (cache hits don't consume budget)
-                cache_key = query_for_call.strip().lower()
+                cache_key = _research_cache_key(query_for_call)
                 tavily_ms = 0
-                if cache_key in research_cache:
+                research_result = research_cache.get(cache_key)
+                if research_result is None and shared_cache_ttl_s > 0:
+                    research_result = research_result_cache.get(shared_cache_prefix + cache_key)
+                    if research_result is not None:
+                        research_cache[cache_key] = research_result
+                        shared_cache_hits += 1
+                if research_result is not None:
                     # Reuse cached result - DO NOT consume budget
-                    research_result = research_cache[cache_key]
                     # Use cached tavily_ms if available, otherwise 0
                     tavily_ms = research_result.get("_cached_tavily_ms", 0)
                 else:
@@ -1300,80 +1719,66 @@ def build_digest_context_with_provider(
                     # Strict cap: at most MAX_RESEARCH_CALLS_PER_DIGEST provider calls per digest build
                     if research_calls_used >= MAX_RESEARCH_CALLS_PER_DIGEST:
                         logger.info("RESEARCH_SKIPPED_BUDGET_CAP", extra={"request_id": req_id})
-                        meeting_id = meeting_data.get("id") or f"meeting_{meeting_idx}"
                         trace = build_research_trace(
                             attempted=True,
-                            outcome=ResearchOutcome.SKIPPED.value,
-                            skip_reason=SkipReason.BUDGET_EXHAUSTED.value,
+                            outcome=_OUTCOME_SKIPPED,
+                            skip_reason=_SKIP_BUDGET_EXHAUSTED,
                             anchor_type=anchor_type_str,
                             anchor_source=anchor_source_str,
                             primary_domain=primary_domain_from_anchor or None,
                             confidence=round(chosen_confidence, 4),
                             query_hash=query_hash_prefix(query_for_call),
                             query_len=len(query_for_call),
-                            timings_ms={"selection_ms": 0, "tavily_ms": 0, "summarize_ms": 0},
+                            timings_ms=_ZERO_TIMINGS,
                         )
-                        research_traces_by_meeting_id[meeting_id] = trace
-                        if isinstance(meeting, dict):
-                            meeting["research_trace"] = trace
-                        elif hasattr(meeting, "__dict__"):
-                            meeting.__dict__["research_trace"] = trace
+                        set_trace_by_meeting_id(meeting_id, trace)
+                        set_meeting_field("research_trace", trace)
                         continue
                     # Check hard cap (8 calls max)
                     if calls_made >= MAX_CALLS_PER_DIGEST:
-                        meeting_id = meeting_data.get("id") or f"meeting_{meeting_idx}"
                         trace = build_research_trace(
                             attempted=True,
-                            outcome=ResearchOutcome.SKIPPED.value,
-                            skip_reason=SkipReason.BUDGET_EXHAUSTED.value,
+                            outcome=_OUTCOME_SKIPPED,
+                            skip_reason=_SKIP_BUDGET_EXHAUSTED,
                             anchor_type=anchor_type_str,
                             anchor_source=anchor_source_str,
                             primary_domain=primary_domain_from_anchor or None,
                             confidence=round(chosen_confidence, 4),
                             query_hash=query_hash_prefix(query_for_call),
                             query_len=len(query_for_call),
-                            timings_ms={"selection_ms": 0, "tavily_ms": 0, "summarize_ms": 0},
+                            timings_ms=_ZERO_TIMINGS,
                         )
-                        research_traces_by_meeting_id[meeting_id] = trace
+                        set_trace_by_meeting_id(meeting_id, trace)
                         # Attach trace to meeting for dev UI
-                        if isinstance(meeting, dict):
-                            meeting["research_trace"] = trace
-                        elif hasattr(meeting, "__dict__"):
-                            meeting.__dict__["research_trace"] = trace
+                        set_meeting_field("research_trace", trace)
                         continue
                     
                     # Check budget right before actual provider call (if provided)
                     if not budget.consume_one_or_false():
-                        meeting_id = meeting_data.get("id") or f"meeting_{meeting_idx}"
                         trace = build_research_trace(
                             attempted=True,
-                            outcome=ResearchOutcome.SKIPPED.value,
-                            skip_reason=SkipReason.BUDGET_EXHAUSTED.value,
+                            outcome=_OUTCOME_SKIPPED,
+                            skip_reason=_SKIP_BUDGET_EXHAUSTED,
                             anchor_type=anchor_type_str,
                             anchor_source=anchor_source_str,
                             primary_domain=primary_domain_from_anchor or None,
                             confidence=round(chosen_confidence, 4),
                             query_hash=query_hash_prefix(query_for_call),
                             query_len=len(query_for_call),
-                            timings_ms={"selection_ms": 0, "tavily_ms": 0, "summarize_ms": 0},
+                            timings_ms=_ZERO_TIMINGS,
                         )
-                        research_traces_by_meeting_id[meeting_id] = trace
+                        set_trace_by_meeting_id(meeting_id, trace)
                         # Attach trace to meeting for dev UI
-                        if isinstance(meeting, dict):
-                            meeting["research_trace"] = trace
-                        elif hasattr(meeting, "__dict__"):
-                            meeting.__dict__["research_trace"] = trace
+                        set_meeting_field("research_trace", trace)
                         continue
                     
                     # Call provider - budget already consumed above
-                    tavily_start = time.perf_counter()
                     try:
                         research_result = provider.get_research(query_for_call)
                     except Exception:
                         research_result = {"summary": "", "key_points": [], "sources": []}
-                    tavily_ms = int((time.perf_counter() - tavily_start) * 1000)
-                    if research_result.get("_duration_ms") is not None:
-                        tavily_ms = research_result.pop("_duration_ms", tavily_ms)
+                    # Provider-side timing (networked providers report _duration_ms; stubs are instant)
+                    tavily_ms = research_result.pop("_duration_ms", None) or 0
                     
                     if research_result.get("sources"):
                         research_result["sources"] = _dedupe_and_cap_sources(
@@ -1383,8 +1788,12 @@ def build_digest_context_with_provider(
                     # Store tavily_ms in cache for trace purposes
                     research_result["_cached_tavily_ms"] = tavily_ms
                     
-                    # Cache result
+                    # Cache result (shared across requests only when there is content; failures are retried next time)
                     research_cache[cache_key] = research_result
+                    if shared_cache_ttl_s > 0 and (
+                        research_result.get("summary") or research_result.get("key_points") or research_result.get("sources")
+                    ):
+                        research_result_cache.set(shared_cache_prefix + cache_key, research_result, shared_cache_ttl_s)
                     calls_made += 1
                     research_calls_used += 1
                 
@@ -1396,8 +1805,7 @@ def build_digest_context_with_provider(
                     )
                 else:
                     result_domain_match_host, domain_match_host = True, None
-                    top_source_hosts = [_host_from_url((s.get("url") or "")) for s in sources_list[:5] if isinstance(s, dict)]
-                    top_source_hosts = [h for h in top_source_hosts if h]
+                    top_source_hosts = _top_source_hosts(sources_list)
                 entity_match_passed: Optional[bool] = None
                 negative_hit = False
                 mismatch_reason_candidate: Optional[str] = None
@@ -1430,23 +1838,18 @@ def build_digest_context_with_provider(
                     # One retry: for ambiguous use LinkedIn/TheOrg; for non-ambiguous use site:expected_domain
                     # Skip retry if strict per-digest cap already reached
                     if org_display and calls_made < MAX_CALLS_PER_DIGEST and research_calls_used < MAX_RESEARCH_CALLS_PER_DIGEST and budget.consume_one_or_false():
-                        if ambiguous_acronym:
-                            retry_query = (
-                                f'"{anchor_display}" "{org_display}" (site:linkedin.com OR site:theorg.com)'
-                                if anchor_type_str == AnchorType.PERSON.value and anchor_display
-                                else f'"{org_display}" (site:linkedin.com OR site:theorg.com)'
-                            )
-                        else:
-                            if anchor_type_str == AnchorType.PERSON.value and anchor_display:
-                                retry_query = f'"{anchor_display}" "{org_display}" site:{expected_domain}'
-                            else:
-                                retry_query = f'"{org_display}" site:{expected_domain}'
-                        tavily_start_retry = time.perf_counter()
+                        retry_query = _build_retry_query(
+                            anchor_display,
+                            org_display,
+                            expected_domain,
+                            anchor_type_str == AnchorType.PERSON.value,
+                            ambiguous_acronym,
+                        )
                         try:
                             retry_result = provider.get_research(retry_query)
                         except Exception:
                             retry_result = {"summary": "", "key_points": [], "sources": []}
-                        tavily_ms_retry = int((time.perf_counter() - tavily_start_retry) * 1000)
+                        tavily_ms_retry = retry_result.pop("_duration_ms", None) or 0
                         if retry_result.get("sources"):
                             retry_result["sources"] = _dedupe_and_cap_sources(
                                 retry_result["sources"], max_items=MAX_RESEARCH_SOURCES
@@ -1463,14 +1866,13 @@ def build_digest_context_with_provider(
                                 final_result = retry_result
                                 result_passed = True
                                 tavily_ms_final = tavily_ms_retry
-                                final_top_hosts = [_host_from_url((s.get("url") or "")) for s in (retry_result.get("sources") or [])[:5] if isinstance(s, dict)]
-                                final_top_hosts = [h for h in final_top_hosts if h]
-                                final_entity_match = True
-                                final_mismatch_reason = None
-                                # Trace: host-based match from accepted result (so domain_match_passed reflects actual sources)
-                                retry_match, retry_host, _ = _result_domain_match_host_based(
+                                # One host pass over the accepted result: top hosts for the trace plus
+                                # the host-based match (so domain_match_passed reflects actual sources)
+                                retry_match, retry_host, final_top_hosts = _result_domain_match_host_based(
                                     retry_result.get("sources") or [], expected_domain
                                 )
+                                final_entity_match = True
+                                final_mismatch_reason = None
                                 if retry_match:
                                     result_domain_match = True
                                     final_domain_match_host = retry_host
@@ -1488,11 +1890,10 @@ def build_digest_context_with_provider(
                                 final_mismatch_reason = None
 
                     if not result_passed:
-                        meeting_id = meeting_data.get("id") or f"meeting_{meeting_idx}"
                         trace = build_research_trace(
                             attempted=True,
-                            outcome=ResearchOutcome.SKIPPED.value,
-                            skip_reason=SkipReason.OFF_TARGET_RESULTS.value,
+                            outcome=_OUTCOME_SKIPPED,
+                            skip_reason=_SKIP_OFF_TARGET_RESULTS,
                             anchor_type=anchor_type_str,
                             anchor_source=anchor_source_str,
                             primary_domain=primary_domain_from_anchor or None,
@@ -1507,38 +1908,17 @@ def build_digest_context_with_provider(
                             query_len=len(query_for_call),
                             timings_ms={"selection_ms": 0, "tavily_ms": tavily_ms_final, "summarize_ms": 0},
                         )
-                        research_traces_by_meeting_id[meeting_id] = trace
-                        if isinstance(meeting, dict):
-                            meeting["research_trace"] = trace
-                        elif hasattr(meeting, "__dict__"):
-                            meeting.__dict__["research_trace"] = trace
+                        set_trace_by_meeting_id(meeting_id, trace)
+                        set_meeting_field("research_trace", trace)
                         continue
                 
                 # Populate from final_result (first call matched or retry matched)
                 meeting_fields = _transform_research_to_meeting_fields(final_result)
                 
                 # Attach fields to meeting (works for both dicts and objects with __dict__)
-                meeting_data_for_update = _meeting_to_data(meeting)
-                meeting_data_for_update.update(meeting_fields)
-                
-                # If meeting is a dict, update it directly
-                if isinstance(meeting, dict):
-                    meeting.update(meeting_fields)
-                # If meeting is a Pydantic model, update via model_dump and reconstruct
-                elif hasattr(meeting, "model_dump") and hasattr(meeting, "model_validate"):
-                    try:
-                        updated_dict = meeting.model_dump()
-                        updated_dict.update(meeting_fields)
-                        # Note: This creates a new model instance, but we can't replace items in the list easily
-                        # For now, update the dict representation which will be used when meetings are serialized
-                        meeting.__dict__.update(updated_dict)
-                    except Exception:
-                        # Fallback: just update __dict__ if model_validate fails
-                        if hasattr(meeting, "__dict__"):
-                            meeting.__dict__.update(meeting_fields)
+                update_meeting_fields(meeting_fields)
                 
                 # Store research_trace for dev/debug; domain_match_url only when domain_match_passed (host-based) is True
-                meeting_id = meeting_data_for_update.get("id") or f"meeting_{meeting_idx}"
                 sources_count = len(final_result.get("sources") or [])
                 has_content = bool(final_result.get("summary") or final_result.get("key_points") or final_result.get("sources"))
                 outcome = ResearchOutcome.SUCCESS.value if has_content else ResearchOutcome.ERROR.value
@@ -1559,12 +1939,9 @@ def build_digest_context_with_provider(
                     timings_ms={"selection_ms": 0, "tavily_ms": tavily_ms_final, "summarize_ms": 0},
                     sources_count=sources_count,
                 )
-                research_traces_by_meeting_id[meeting_id] = trace
+                set_trace_by_meeting_id(meeting_id, trace)
                 # Attach trace to meeting for dev UI
-                if isinstance(meeting, dict):
-                    meeting["research_trace"] = trace
-                elif hasattr(meeting, "__dict__"):
-                    meeting.__dict__["research_trace"] = trace
+                set_meeting_field("research_trace", trace)
             
             # Store research traces in context for dev/debug (not rendered in prod templates)
             context["research_traces_by_meeting_id"] = research_traces_by_meeting_id
@@ -1580,11 +1957,11 @@ def build_digest_context_with_provider(
             context["_research_computed"] = True
             
             # Log summary (non-PII)
-            eligible_meetings = [m for m in meetings_with_memory or [] if score_meeting_for_research(_meeting_to_data(m)) >= 0]
             logger.info("RESEARCH_PER_MEETING_COMPLETE", extra={
-                "meetings_processed": len(eligible_meetings),
+                "meetings_processed": eligible_count,
                 "calls_made": calls_made,
                 "cache_hits": len(research_traces_by_meeting_id) - calls_made if len(research_traces_by_meeting_id) >= calls_made else 0,
+                "shared_cache_hits": shared_cache_hits,
                 "request_id": req_id,
             })
 
@@ -1649,15 +2026,14 @@ def build_single_event_context(
             # Pass mailbox/user to filter events for specific user
             events = provider.fetch_events(requested_date, user=user_mailbox)
             if events:
-                # Find event by ID (assuming event has an 'id' field)
-                for event in events:
-                    event_dict = event.model_dump() if hasattr(event, 'model_dump') else event
-                    if event_dict.get('id') == event_id:
-                        meetings = _map_events_to_meetings([event_dict])
-                        if meetings:
-                            meeting = meetings[0]
-                            actual_source = "live"
-                        break
+                # Find event by ID (assuming event has an 'id' field); next() stops at the first match
+                event_dicts = (e.model_dump() if hasattr(e, 'model_dump') else e for e in events)
+                event_dict = next((d for d in event_dicts if d.get('id') == event_id), None)
+                if event_dict is not None:
+                    meetings = _map_events_to_meetings([event_dict])
+                    if meetings:
+                        meeting = meetings[0]
+                        actual_source = "live"
         except HTTPException:
             # Re-raise HTTPExceptions (e.g., 403, 401) so they propagate with correct status codes
             raise
@@ -1717,23 +2093,13 @@ def build_single_event_context(
             "high_leverage_questions": [],
         }
 
-    # Apply company aliases before enrichment
-    meetings = [meeting]
-    meetings = _apply_company_aliases(meetings, profile.company_aliases)
-
-    # Optionally enrich meetings
-    meetings_enriched = enrich_meetings(meetings)
-
-    # Apply profile max_items limits
-    meetings_trimmed = _trim_meeting_sections(meetings_enriched, profile.max_items)
-
-    # Attach memory data (past meetings) to each meeting
-    meetings_with_memory = attach_memory_to_meetings(meetings_trimmed)
+    # Aliases, enrichment, max_items limits and memory for the single meeting
+    meetings_with_memory = [_pipeline_meeting(meeting, profile.company_aliases, profile.max_items)]
 
     # Format date_human based on requested date (or today if not specified)
-    tz_name = _get_timezone()
+    tz = _get_timezone()
     if requested_date:
-        date_human = _format_date_et_str(requested_date, tz_name)
+        date_human = _format_date_et_str(requested_date, tz)
         # Extract year from requested date for current_year
         try:
             date_obj = datetime.strptime(requested_date, "%Y-%m-%d")
@@ -1741,7 +2107,7 @@ def build_single_event_context(
         except ValueError:
             current_year = datetime.now().strftime("%Y")
     else:
-        date_human = _today_et_str(tz_name)
+        date_human = _today_et_str(tz)
         current_year = datetime.now().strftime("%Y")
 
     context = {
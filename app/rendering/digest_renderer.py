@@ -1,4 +1,5 @@
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Any, Literal, Optional
 from zoneinfo import ZoneInfo
 import os
@@ -12,33 +13,42 @@ from app.data.sample_digest import SAMPLE_MEETINGS
 templates = Jinja2Templates(directory="app/templates")
 
 
-def _today_et_str(tz_name: str) -> str:
+def _today_et_str(tz: ZoneInfo) -> str:
     """Format today's date in the specified timezone."""
-    tz = ZoneInfo(tz_name)
     now = datetime.now(tz)
     day = str(int(now.strftime("%d")))
     return f"{now.strftime('%a')}, {now.strftime('%b')} {day}, {now.strftime('%Y')}"
 
 
-def _format_date_et_str(date_str: str, tz_name: str) -> str:
+@lru_cache(maxsize=64)
+def _format_valid_date_et_str(date_str: str, tz: ZoneInfo) -> str:
+    """Format a YYYY-MM-DD date in tz; raises ValueError/TypeError (not cached) on bad input."""
+    # Parse the date string
+    date_obj = datetime.strptime(date_str, "%Y-%m-%d")
+    # Localize the date to the timezone (at midnight)
+    date_tz = date_obj.replace(tzinfo=tz)
+    day = str(int(date_tz.strftime("%d")))
+    return f"{date_tz.strftime('%a')}, {date_tz.strftime('%b')} {day}, {date_tz.strftime('%Y')}"
+
+
+def _format_date_et_str(date_str: str, tz: ZoneInfo) -> str:
     """Format a specific date (YYYY-MM-DD) in the specified timezone."""
     try:
-        # Parse the date string
-        date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-        # Get timezone
-        tz = ZoneInfo(tz_name)
-        # Localize the date to the timezone (at midnight)
-        date_tz = date_obj.replace(tzinfo=tz)
-        day = str(int(date_tz.strftime("%d")))
-        return f"{date_tz.strftime('%a')}, {date_tz.strftime('%b')} {day}, {date_tz.strftime('%Y')}"
+        return _format_valid_date_et_str(date_str, tz)
     except (ValueError, TypeError):
-        # Fallback to today if parsing fails
-        return _today_et_str(tz_name)
+        # Fallback to today if parsing fails (never cached, so it tracks the current day)
+        return _today_et_str(tz)
+
+
+@lru_cache(maxsize=4)
+def _zoneinfo(tz_name: str) -> ZoneInfo:
+    """Resolve a timezone name once; later calls reuse the same ZoneInfo object."""
+    return ZoneInfo(tz_name)
 
 
-def _get_timezone() -> str:
+def _get_timezone() -> ZoneInfo:
     """Get timezone from environment or default to America/New_York."""
-    return os.getenv("TIMEZONE", "America/New_York")
+    return _zoneinfo(os.getenv("TIMEZONE", "America/New_York"))
 
 
 def _assemble_live_meetings() -> list:
@@ -93,8 +103,10 @@ def render_digest_html(context: Dict[str, Any]) -> str:
     request = context.get("request")
     if request is None:
         request = Request(scope={"type": "http"})
-    template = templates.get_template("digest.html")
-    html = template.render({**context, "request": request})
+    # Template.render builds its own context dict from (mapping, **kwargs); no merged copy needed here
+    # get_template per render: Jinja's environment cache keeps the compiled template, and its
+    # auto_reload up-to-date check picks up edits to digest.html without a restart
+    html = templates.get_template("digest.html").render(context, request=request)
     return html
 
 
@@ -1,4 +1,44 @@
-from typing import Dict, Any, List
+from __future__ import annotations
+
+import io
+from itertools import islice
+from typing import TYPE_CHECKING
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from typing import Dict, Any, List, Tuple
+
+# Separator lines (newline included) shared by every render
+_HEADER_SEP = "=" * 50 + "\n"
+_MEETING_SEP = "-" * 60 + "\n"
+_MEETING_DIVIDER = "=" * 60 + "\n"
+_FOOTER_SEP = "-" * 60 + "\n"
+
+# Bulleted list section headers
+_STRATEGIC_ANGLES_HEADER = "Strategic Angles:\n"
+_QUESTIONS_HEADER = "High-Leverage Questions:\n"
+
+
+def _get(obj: Any, key: str, default: Any = None) -> Any:
+    """
+    Read a field from a dict or a Pydantic model without model_dump().
+
+    Models only expose declared fields, matching what model_dump() would have
+    returned; nested models are read the same way by the callers.
+    """
+    if isinstance(obj, dict):
+        return obj.get(key, default)
+    if key in type(obj).model_fields:
+        return getattr(obj, key, default)
+    return default
+
+
+def _extract_company(company: Any) -> Tuple[str, str]:
+    """(name, one_liner) from a company dict or model; ("", "") when missing or another type (e.g. a string)."""
+    if not company or not isinstance(company, (dict, BaseModel)):
+        return "", ""
+    return _get(company, "name", ""), _get(company, "one_liner", "")
 
 
 def render_plaintext(context: Dict[str, Any]) -> str:
@@ -11,201 +51,186 @@ def render_plaintext(context: Dict[str, Any]) -> str:
     Returns:
         Plaintext digest string
     """
-    lines = []
-
-    # Header
-    lines.append("RPCK – Morning Briefing")
-    lines.append("=" * 50)
-    lines.append("")
-    lines.append(f"Prepared for {context.get('exec_name', 'Sorum Crofts')}")
-    lines.append(f"Date: {context.get('date_human', '')}")
-    lines.append("")
+    buf = io.StringIO()
+    w = buf.write
 
-    # Legend
-    lines.append("Legend: [Today] [Action-oriented]")
-    lines.append("")
+    # Header and legend
+    w(
+        f"RPCK – Morning Briefing\n{_HEADER_SEP}\n"
+        f"Prepared for {context.get('exec_name', 'Sorum Crofts')}\n"
+        f"Date: {context.get('date_human', '')}\n\n"
+        "Legend: [Today] [Action-oriented]\n\n"
+    )
 
     meetings = context.get("meetings", [])
     if not meetings:
-        lines.append("No meetings scheduled for today.")
-        return "\n".join(lines)
+        w("No meetings scheduled for today.")
+        return buf.getvalue()
+
+    # Dev-only diagnostics flag is per digest, not per meeting
+    app_env = context.get("app_env", "").strip().lower()
+    dev_diagnostics = app_env == "development" or context.get("enable_research_dev", False)
 
     # Meetings
     for i, meeting in enumerate(meetings, 1):
-        # Handle both dict and Pydantic model
-        if hasattr(meeting, 'model_dump'):
-            # Pydantic model
-            meeting_dict = meeting.model_dump()
-            subject = meeting_dict.get("subject", "Untitled Meeting")
-            start_time = meeting_dict.get("start_time", "")
-            location = meeting_dict.get("location", "")
-            attendees = meeting_dict.get("attendees", [])
-            company = meeting_dict.get("company")
-            news = meeting_dict.get("news", [])
-            context_summary = meeting_dict.get("context_summary")
-            industry_signal = meeting_dict.get("industry_signal")
-            strategic_angles = meeting_dict.get("strategic_angles", [])
-            high_leverage_questions = meeting_dict.get("high_leverage_questions", [])
-            research_trace = meeting_dict.get("research_trace")
-            memory = meeting_dict.get("memory")
-        else:
-            # Regular dict
-            subject = meeting.get("subject", "Untitled Meeting")
-            start_time = meeting.get("start_time", "")
-            location = meeting.get("location", "")
-            attendees = meeting.get("attendees", [])
-            company = meeting.get("company")
-            news = meeting.get("news", [])
-            context_summary = meeting.get("context_summary")
-            industry_signal = meeting.get("industry_signal")
-            strategic_angles = meeting.get("strategic_angles", [])
-            high_leverage_questions = meeting.get("high_leverage_questions", [])
-            research_trace = meeting.get("research_trace")
-            memory = meeting.get("memory")
-
-        lines.append(f"Meeting {i}: {subject}")
-        lines.append("-" * 60)
+        # Handle both dict and Pydantic model (fields read directly; no model_dump copy)
+        subject = _get(meeting, "subject", "Untitled Meeting")
+        start_time = _get(meeting, "start_time", "")
+        location = _get(meeting, "location", "")
+        attendees = _get(meeting, "attendees", [])
+        company = _get(meeting, "company")
+        news = _get(meeting, "news", [])
+        context_summary = _get(meeting, "context_summary")
+        industry_signal = _get(meeting, "industry_signal")
+        strategic_angles = _get(meeting, "strategic_angles", [])
+        high_leverage_questions = _get(meeting, "high_leverage_questions", [])
+        research_trace = _get(meeting, "research_trace")
+        memory = _get(meeting, "memory")
+
+        w(f"Meeting {i}: {subject}\n")
+        w(_MEETING_SEP)
 
         # Time and location
         if start_time:
-            lines.append(f"Starts: {start_time}")
+            w(f"Starts: {start_time}\n")
         if location:
-            lines.append(f"Location: {location}")
-        lines.append("")
+            w(f"Location: {location}\n")
+        w("\n")
 
         # Attendees
         if attendees:
-            lines.append("Attendees:")
+            w("Attendees:\n")
             for attendee in attendees:
-                name = attendee.get("name", "")
-                title = attendee.get("title", "")
-                attendee_company = attendee.get("company", "")
+                name = _get(attendee, "name", "")
+                title = _get(attendee, "title", "")
+                attendee_company = _get(attendee, "company", "")
 
-                attendee_line = f"  • {name}"
+                # Fragments go straight into the buffer (no per-attendee += copies)
+                w(f"  • {name}")
                 if title:
-                    attendee_line += f", {title}"
+                    w(f", {title}")
                 if attendee_company:
-                    attendee_line += f" ({attendee_company})"
-                lines.append(attendee_line)
-            lines.append("")
+                    w(f" ({attendee_company})")
+                w("\n")
+            w("\n")
 
         # Company
-        if company:
-            # Handle both dict and Pydantic model
-            if hasattr(company, 'model_dump'):
-                # Pydantic model
-                company_dict = company.model_dump()
-                company_name = company_dict.get("name", "")
-                one_liner = company_dict.get("one_liner", "")
-            elif isinstance(company, dict):
-                # Regular dict
-                company_name = company.get("name", "")
-                one_liner = company.get("one_liner", "")
-            else:
-                # Skip if company is not a dict or model (e.g., string)
-                company_name = ""
-                one_liner = ""
-
-            if company_name:
-                lines.append("Company:")
-                lines.append(f"  {company_name}")
-                if one_liner:
-                    lines.append(f"  {one_liner}")
-                lines.append("")
+        company_name, one_liner = _extract_company(company)
+        if company_name:
+            w(f"Company:\n  {company_name}\n")
+            if one_liner:
+                w(f"  {one_liner}\n")
+            w("\n")
 
         # 1) Context Snapshot
         has_context = context_summary or news or industry_signal or strategic_angles or high_leverage_questions
-        lines.append("Context Snapshot:")
+        w("Context Snapshot:\n")
         if has_context:
             if context_summary:
-                lines.append(f"  {context_summary}")
+                w(f"  {context_summary}\n")
             if news:
-                lines.append("  Recent developments:")
+                w("  Recent developments:\n")
                 for item in news:
+                    # One type test per item: dicts (the common case) are read directly
                     if isinstance(item, dict):
                         title = item.get("title", "")
                         url = item.get("url", "")
-                        if title and url:
-                            lines.append(f"    • {title} ({url})")
-                        elif title:
-                            lines.append(f"    • {title}")
+                    elif isinstance(item, BaseModel):
+                        title = _get(item, "title", "")
+                        url = _get(item, "url", "")
                     else:
-                        lines.append(f"    • {item}")
+                        w(f"    • {item}\n")
+                        continue
+                    if title and url:
+                        w(f"    • {title} ({url})\n")
+                    elif title:
+                        w(f"    • {title}\n")
             if industry_signal:
-                lines.append(f"  Industry signal: {industry_signal}")
+                w(f"  Industry signal: {industry_signal}\n")
         else:
-            lines.append("  No external context available")
+            w("  No external context available\n")
         # Dev-only anchor diagnostics (non-PII)
-        app_env = context.get("app_env", "").strip().lower()
-        enable_research_dev = context.get("enable_research_dev", False)
-        if research_trace and (app_env == "development" or enable_research_dev):
-            anchor_type = research_trace.get("anchor_type") or "—"
-            primary_domain = research_trace.get("primary_domain") or "—"
-            dm = research_trace.get("domain_match_passed")
+        if research_trace and dev_diagnostics:
+            rt_get = research_trace.get
+            anchor_type = rt_get("anchor_type") or "—"
+            primary_domain = rt_get("primary_domain") or "—"
+            dm = rt_get("domain_match_passed")
             domain_match_str = "true" if dm is True else ("false" if dm is False else "—")
-            match_url = (research_trace.get("domain_match_url") or "—") if dm is True else "—"
-            top_hosts = research_trace.get("top_source_hosts") or []
-            hosts_str = ",".join(top_hosts[:3]) if top_hosts else "—"
-            part = f"  [Dev] Anchor={anchor_type} | domain={primary_domain} | domain_match={domain_match_str} | match_url={match_url} | hosts={hosts_str}"
-            em = research_trace.get("entity_match_passed")
+            match_url = (rt_get("domain_match_url") or "—") if dm is True else "—"
+            top_hosts = rt_get("top_source_hosts")
+            hosts_str = ",".join(islice(top_hosts, 3)) if top_hosts else "—"
+            # Fragments go straight into the buffer instead of growing one string with +=
+            w(f"  [Dev] Anchor={anchor_type} | domain={primary_domain} | domain_match={domain_match_str} | match_url={match_url} | hosts={hosts_str}")
+            em = rt_get("entity_match_passed")
             if em is not None:
-                part += f" | entity_match={'true' if em else 'false'}"
-            if research_trace.get("skip_reason"):
-                part += f" | skip={research_trace.get('skip_reason')}"
-            if research_trace.get("mismatch_reason"):
-                part += f" | mismatch={research_trace.get('mismatch_reason')}"
-            if research_trace.get("retry_used"):
-                part += " | retry=true"
-            if research_trace.get("outcome") == "error":
-                part += " | outcome=error"
-            lines.append(part)
-        lines.append("")
-
-        # 2) Strategic Angles (only if data; no filler)
-        if strategic_angles:
-            lines.append("Strategic Angles:")
-            for a in strategic_angles:
-                lines.append(f"  • {a}")
-            lines.append("")
-
-        # 3) High-Leverage Questions (only if data; no filler)
-        if high_leverage_questions:
-            lines.append("High-Leverage Questions:")
-            for q in high_leverage_questions:
-                lines.append(f"  • {q}")
-            lines.append("")
+                w(" | entity_match=true" if em else " | entity_match=false")
+            skip_reason = rt_get("skip_reason")
+            if skip_reason:
+                w(f" | skip={skip_reason}")
+            mismatch_reason = rt_get("mismatch_reason")
+            if mismatch_reason:
+                w(f" | mismatch={mismatch_reason}")
+            if rt_get("retry_used"):
+                w(" | retry=true")
+            if rt_get("outcome") == "error":
+                w(" | outcome=error")
+            w("\n")
+        w("\n")
+
+        # 2) Strategic Angles, 3) High-Leverage Questions (only if data; no filler)
+        for header, items in ((_STRATEGIC_ANGLES_HEADER, strategic_angles), (_QUESTIONS_HEADER, high_leverage_questions)):
+            if items:
+                w(header)
+                for item in items:
+                    w(f"  • {item}\n")
+                w("\n")
 
         # Memory (Recent with them)
         if memory and isinstance(memory, dict):
             previous_meetings = memory.get("previous_meetings", [])
             if previous_meetings:
-                lines.append("Recent with them:")
+                w("Recent with them:\n")
                 for past_meeting in previous_meetings:
                     if isinstance(past_meeting, dict):
                         date = past_meeting.get("date", "")
                         subject = past_meeting.get("subject", "")
                         key_attendees = past_meeting.get("key_attendees", [])
 
-                        meeting_line = f"  • {date} — {subject}"
                         if key_attendees:
-                            attendees_str = ", ".join(key_attendees)
-                            meeting_line += f" (with {attendees_str})"
-                        lines.append(meeting_line)
-                lines.append("")
+                            w(f"  • {date} — {subject} (with {', '.join(key_attendees)})\n")
+                        else:
+                            w(f"  • {date} — {subject}\n")
+                w("\n")
 
         # Separator between meetings
         if i < len(meetings):
-            lines.append("")
-            lines.append("=" * 60)
-            lines.append("")
+            w(f"\n{_MEETING_DIVIDER}\n")
 
     # Footer
-    lines.append("")
-    lines.append("-" * 60)
-    lines.append(f"© {context.get('current_year', '2025')} RPCK Rastegar Panchal LLP — Internal briefing.")
-    lines.append("If anything looks off, reply and I'll regenerate with fixes.")
+    w(
+        f"\n{_FOOTER_SEP}"
+        f"© {context.get('current_year', '2025')} RPCK Rastegar Panchal LLP — Internal briefing.\n"
+        "If anything looks off, reply and I'll regenerate with fixes."
+    )
+
+    return buf.getvalue()
+
 
-    return "\n".join(lines)
+def _format_attendee_plaintext(attendee: Dict[str, Any]) -> str:
+    """Format one attendee as 'Name, Title (Company)', omitting empty parts."""
+    name = attendee.get("name", "")
+    title = attendee.get("title", "")
+    company = attendee.get("company", "")
+
+    parts = [name]
+    if title:
+        parts.append(", ")
+        parts.append(title)
+    if company:
+        parts.append(" (")
+        parts.append(company)
+        parts.append(")")
+    return "".join(parts)
 
 
 def _format_attendees_plaintext(attendees: List[Dict[str, Any]]) -> str:
@@ -221,21 +246,7 @@ def _format_attendees_plaintext(attendees: List[Dict[str, Any]]) -> str:
     if not attendees:
         return ""
 
-    formatted = []
-    for attendee in attendees:
-        name = attendee.get("name", "")
-        title = attendee.get("title", "")
-        company = attendee.get("company", "")
-
-        attendee_str = name
-        if title:
-            attendee_str += f", {title}"
-        if company:
-            attendee_str += f" ({company})"
-
-        formatted.append(attendee_str)
-
-    return "; ".join(formatted)
+    return "; ".join(map(_format_attendee_plaintext, attendees))
 
 
 def _format_news_plaintext(news: List[Any]) -> str:
@@ -1,16 +1,22 @@
 """
 Helpers for research anchor extraction: org/project from subject and from email domain.
 """
+from __future__ import annotations
+
 import re
-from typing import Set
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import FrozenSet, Tuple
 
 # Domains we treat as consumer/personal; do not use as org anchors
-CONSUMER_DOMAINS: Set[str] = {
+CONSUMER_DOMAINS: FrozenSet[str] = frozenset({
     "gmail.com", "googlemail.com", "yahoo.com", "yahoo.co.uk", "outlook.com",
     "hotmail.com", "hotmail.co.uk", "live.com", "msn.com", "icloud.com",
     "aol.com", "mail.com", "protonmail.com", "zoho.com", "yandex.com",
     "gmx.com", "gmx.net", "fastmail.com", "me.com", "mac.com",
-}
+})
 
 # Known domain (first segment) -> display org name for research query
 DOMAIN_ORG_OVERRIDES = {
@@ -26,8 +32,23 @@ ASSISTANT_DOMAIN_MARKERS = (
     "chiefofstaff", "assistant", "ea", "pa", "admin", "concierge",
     "chief-of-staff", "executive-assistant", "personal-assistant",
 )
+# Markers with hyphens removed: exact-match set, plus the longer ones (>= 4 chars) also matched as substrings
+_ASSISTANT_FLAT_SET = frozenset(m.replace("-", "") for m in ASSISTANT_DOMAIN_MARKERS)
+_ASSISTANT_LONG = tuple(m for m in _ASSISTANT_FLAT_SET if len(m) >= 4)
+
+# Host prefixes dropped before taking a domain's first segment for an org name
+_DOMAIN_PREFIXES = ("www.", "mail.", "calendar.", "cms.", "cms-")
 
+# Subject separators for extract_org_from_subject ("... re: X", "... regarding X")
+_RE_SPLIT = re.compile(r"\s+re:\s+", re.IGNORECASE)
+_REGARDING_SPLIT = re.compile(r"\s+regarding\s+", re.IGNORECASE)
 
+# Generic trailing words stripped from a subject org phrase, applied in order
+_GENERIC_SUBJECT_SUFFIXES = ("call", "meeting", "introductory", "intro", "sync")
+_GENERIC_SUFFIX_CUTS = tuple((suf, " " + suf, len(suf) + 1) for suf in _GENERIC_SUBJECT_SUFFIXES)
+
+
+@lru_cache(maxsize=512)
 def _first_segment(domain: str) -> str:
     """Return lowercased first segment (registrable) of domain."""
     if not domain or not isinstance(domain, str):
@@ -38,6 +59,7 @@ def _first_segment(domain: str) -> str:
     return d
 
 
+@lru_cache(maxsize=512)
 def looks_like_personal_domain(domain: str) -> bool:
     """
     Heuristics for domains that look like a personal name rather than an organization.
@@ -65,6 +87,7 @@ def looks_like_personal_domain(domain: str) -> bool:
     return False
 
 
+@lru_cache(maxsize=512)
 def looks_like_assistant_domain(domain: str) -> bool:
     """
     Heuristics for domains that look like an assistant/PA service rather than the principal org.
@@ -74,15 +97,13 @@ def looks_like_assistant_domain(domain: str) -> bool:
         return False
     segment = _first_segment(domain)
     segment_flat = segment.replace("-", "").replace("_", "")
-    for marker in ASSISTANT_DOMAIN_MARKERS:
-        m = marker.replace("-", "")
-        if segment_flat == m:
-            return True
-        if len(m) >= 4 and m in segment_flat:  # longer markers (chiefofstaff, assistant, admin, concierge) as substring
-            return True
-    return False
+    if segment_flat in _ASSISTANT_FLAT_SET:
+        return True
+    # longer markers (chiefofstaff, assistant, admin, concierge) as substring
+    return any(m in segment_flat for m in _ASSISTANT_LONG)
 
 
+@lru_cache(maxsize=512)
 def is_consumer_domain(domain: str) -> bool:
     """Return True if domain is a consumer/personal email provider (ignore for org anchor)."""
     if not domain or not isinstance(domain, str):
@@ -90,31 +111,44 @@ def is_consumer_domain(domain: str) -> bool:
     return domain.strip().lower() in CONSUMER_DOMAINS
 
 
-def domain_to_org_name(domain: str) -> str:
+@lru_cache(maxsize=1024)
+def _normalize_domain(domain: str) -> Tuple[str, str]:
     """
-    Convert email domain to human-readable org name for research query.
-    Uses overrides for known acronyms/names (e.g. csa -> CSA, gatesfoundation -> Gates Foundation).
-    Otherwise same logic as org_from_email_domain (first segment, title-case).
+    Shared normalization for org-name helpers: strip a known host prefix, take the first
+    segment, and turn '-'/'_' into spaces. Returns (registrable_spaced, override_key).
     """
-    if not domain or not domain.strip():
-        return ""
     d = domain.strip().lower()
-    for prefix in ("www.", "mail.", "calendar.", "cms.", "cms-"):
-        if d.startswith(prefix):
-            d = d[len(prefix):]
-            break
+    # Strip at most one known prefix; the tuple startswith fails fast for most domains
+    if d.startswith(_DOMAIN_PREFIXES):
+        for prefix in _DOMAIN_PREFIXES:
+            if d.startswith(prefix):
+                d = d[len(prefix):]
+                break
     if "." in d:
         registrable = d.split(".", 1)[0]
     else:
         registrable = d
     registrable = registrable.replace("-", " ").replace("_", " ")
+    return registrable, registrable.replace(" ", "")
+
+
+@lru_cache(maxsize=1024)
+def domain_to_org_name(domain: str) -> str:
+    """
+    Convert email domain to human-readable org name for research query.
+    Uses overrides for known acronyms/names (e.g. csa -> CSA, gatesfoundation -> Gates Foundation).
+    Otherwise same logic as org_from_email_domain (first segment, title-case).
+    """
+    if not domain or not domain.strip():
+        return ""
+    _, key = _normalize_domain(domain)
     # Known override (e.g. csa -> CSA, gatesfoundation -> Gates Foundation)
-    key = registrable.replace(" ", "").lower()
     if key in DOMAIN_ORG_OVERRIDES:
         return DOMAIN_ORG_OVERRIDES[key]
-    return " ".join(w.capitalize() for w in registrable.split() if w)
+    return org_from_email_domain(domain)
 
 
+@lru_cache(maxsize=512)
 def extract_org_from_subject(subject: str) -> str:
     """
     Extract org/project phrase from subject (e.g. 'Introductory call on Kheyti Project' -> 'Kheyti Project').
@@ -123,28 +157,32 @@ def extract_org_from_subject(subject: str) -> str:
     if not subject or not subject.strip():
         return ""
     subj = subject.strip()
+    subj_lower = subj.lower()
     trailing = ""
     if " on " in subj:
         trailing = subj.split(" on ", 1)[1].strip()
-    elif " re: " in subj.lower():
-        parts = re.split(r"\s+re:\s+", subj, flags=re.IGNORECASE, maxsplit=1)
+    elif " re: " in subj_lower:
+        parts = _RE_SPLIT.split(subj, maxsplit=1)
         if len(parts) > 1:
             trailing = parts[1].strip()
-    elif " regarding " in subj.lower():
-        parts = re.split(r"\s+regarding\s+", subj, flags=re.IGNORECASE, maxsplit=1)
+    elif " regarding " in subj_lower:
+        parts = _REGARDING_SPLIT.split(subj, maxsplit=1)
         if len(parts) > 1:
             trailing = parts[1].strip()
     elif ":" in subj:
         trailing = subj.split(":", 1)[1].strip()
     if not trailing:
         return ""
-    generic_suffixes = ("call", "meeting", "introductory", "intro", "sync")
-    for suf in generic_suffixes:
-        if trailing.lower().endswith(" " + suf):
-            trailing = trailing[: -(len(suf) + 1)].strip()
-        if trailing.lower() == suf:
-            trailing = ""
-            break
+    low = trailing.lower()
+    # Most subjects end in none of the suffixes; one C-level endswith skips the loop
+    if low.endswith(_GENERIC_SUBJECT_SUFFIXES):
+        for suf, spaced_suf, cut in _GENERIC_SUFFIX_CUTS:
+            if low.endswith(spaced_suf):
+                trailing = trailing[:-cut].strip()
+                low = trailing.lower()
+            if low == suf:
+                trailing = ""
+                break
     if not trailing or len(trailing) < 3 or len(trailing) > 60:
         return ""
     tokens = trailing.split()
@@ -153,6 +191,7 @@ def extract_org_from_subject(subject: str) -> str:
     return ""
 
 
+@lru_cache(maxsize=1024)
 def org_from_email_domain(domain: str) -> str:
     """
     Convert email domain to human-readable org name (e.g. cms-induslaw.com -> Induslaw).
@@ -160,16 +199,8 @@ def org_from_email_domain(domain: str) -> str:
     """
     if not domain or not domain.strip():
         return ""
-    d = domain.strip().lower()
-    for prefix in ("www.", "mail.", "calendar.", "cms.", "cms-"):
-        if d.startswith(prefix):
-            d = d[len(prefix):]
-            break
-    # Take first segment (e.g. betacorp.co.uk -> betacorp, induslaw.com -> induslaw)
-    if "." in d:
-        registrable = d.split(".", 1)[0]
-    else:
-        registrable = d
-    registrable = registrable.replace("-", " ").replace("_", " ")
-    result = " ".join(w.capitalize() for w in registrable.split() if w)
-    return result
+    # First segment (e.g. betacorp.co.uk -> betacorp, induslaw.com -> induslaw), title-cased
+    registrable, _ = _normalize_domain(domain)
+    # split() never yields empty words; map(str.capitalize) avoids a generator frame per word.
+    # (str.title() is not equivalent: it would also capitalize after digits, e.g. "3m" -> "3M".)
+    return " ".join(map(str.capitalize, registrable.split()))
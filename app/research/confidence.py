@@ -4,7 +4,10 @@ Anchor confidence scoring and gating for research.
 Confidence in [0, 1]. Research runs only when confidence >= CONF_MIN (default 0.70).
 One fallback strategy is allowed before skipping.
 """
-from typing import Any, Dict, Optional
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 
 # Generic email/consumer domains (low signal for B2B research)
 GENERIC_DOMAINS = frozenset({
@@ -13,7 +16,25 @@ GENERIC_DOMAINS = frozenset({
     "mail.com", "zoho.com", "yandex.com", "gmial.com", "google.com",
 })
 
+# Subject keyword sets, each compiled into one alternation so a subject is scanned once per set
+_ORG_KEYWORDS = ("intro", "introductory", "call on", "meeting on", "re:", "regarding", "project", "partnership")
+_VAGUE_PHRASES = ("catch up", "catch-up", "quick chat", "sync", "check-in", "check in", "touch base", "reconnect")
+_TEST_MARKERS = ("test", "dummy", "sandbox", "qa", "asdf", "zzz")
 
+
+def _alternation(words: Tuple[str, ...]) -> str:
+    return "|".join(re.escape(w) for w in words)
+
+
+_ORG_KEYWORD_RE = re.compile(_alternation(_ORG_KEYWORDS))
+# Vague phrase as the whole subject, its first word(s), or its last word(s)
+_VAGUE_SUBJECT_RE = re.compile(
+    rf"\A(?:{_alternation(_VAGUE_PHRASES)})(?: |\Z)| (?:{_alternation(_VAGUE_PHRASES)})\Z"
+)
+_TEST_MARKER_RE = re.compile(_alternation(_TEST_MARKERS))
+
+
+@lru_cache(maxsize=4096)
 def domain_root(domain: str) -> str:
     """Registrable part of domain (e.g. smg.com -> smg, acmecapital.com -> acmecapital)."""
     if not domain or not isinstance(domain, str):
@@ -30,16 +51,15 @@ def domain_root_length(domain: str) -> int:
     return len(domain_root(domain))
 
 
+@lru_cache(maxsize=4096)
 def is_domain_generic(domain: str) -> bool:
     """True if domain is a generic consumer email provider."""
     if not domain:
         return False
-    root = domain_root(domain)
-    # Check full domain and root
+    # Full-domain check only: a registrable root (e.g. "gmail") never contains a dot, so it
+    # can never be a GENERIC_DOMAINS entry and does not need to be parsed here
     full = domain.strip().lower()
-    if full in GENERIC_DOMAINS:
-        return True
-    return root in GENERIC_DOMAINS or full.endswith(".gmail.com") or "google" in full
+    return full in GENERIC_DOMAINS or full.endswith(".gmail.com") or "google" in full
 
 
 def is_domain_ambiguous_short(domain: str) -> bool:
@@ -51,18 +71,14 @@ def subject_has_org_keyword(subject: str) -> bool:
     """True if subject contains org/project-style keywords."""
     if not subject:
         return False
-    s = subject.lower()
-    keywords = ("intro", "introductory", "call on", "meeting on", "re:", "regarding", "project", "partnership")
-    return any(kw in s for kw in keywords)
+    return _ORG_KEYWORD_RE.search(subject.lower()) is not None
 
 
 def is_vague_subject(subject: str) -> bool:
     """True if subject is vague (catch up, quick chat, sync, check-in)."""
     if not subject:
         return True
-    s = subject.strip().lower()
-    vague = ("catch up", "catch-up", "quick chat", "sync", "check-in", "check in", "touch base", "reconnect")
-    return any(s == v or s.startswith(v + " ") or s.endswith(" " + v) for v in vague)
+    return _VAGUE_SUBJECT_RE.search(subject.strip().lower()) is not None
 
 
 def is_meeting_like_test(
@@ -71,8 +87,7 @@ def is_meeting_like_test(
 ) -> bool:
     """True if meeting looks like a test (subject or single self-attendee)."""
     subject = (meeting_data.get("subject") or meeting_data.get("title") or "").strip().lower()
-    test_markers = ("test", "dummy", "sandbox", "qa", "asdf", "zzz")
-    if any(m in subject for m in test_markers):
+    if _TEST_MARKER_RE.search(subject) is not None:
         return True
     attendees = meeting_data.get("attendees") or []
     if not attendees and mailbox:
@@ -90,6 +105,27 @@ def is_meeting_like_test(
     return _email(attendees[0]) == mailbox_lower
 
 
+@dataclass(frozen=True, slots=True)
+class SubjectFeatures:
+    """Subject/test signals for one meeting; identical for every compute_confidence call on it."""
+    has_org_keyword: bool
+    is_vague: bool
+    is_test: bool
+
+
+def subject_features(
+    meeting_data: Dict[str, Any],
+    mailbox: Optional[str] = None,
+) -> SubjectFeatures:
+    """Extract the subject signals once so the anchor fallback ladder can reuse them."""
+    subject = (meeting_data.get("subject") or meeting_data.get("title") or "").strip()
+    return SubjectFeatures(
+        has_org_keyword=subject_has_org_keyword(subject),
+        is_vague=is_vague_subject(subject),
+        is_test=is_meeting_like_test(meeting_data, mailbox),
+    )
+
+
 def compute_confidence(
     *,
     meeting_data: Dict[str, Any],
@@ -100,20 +136,25 @@ def compute_confidence(
     has_external_domain: bool,
     has_attendee_display_name: bool,
     mailbox: Optional[str] = None,
+    features: Optional[SubjectFeatures] = None,
 ) -> float:
     """
     Compute anchor confidence in [0, 1].
     Uses only non-PII inputs (flags and domain root, not raw subject/names).
+    Pass precomputed `features` (see subject_features) when scoring one meeting repeatedly.
     """
+    if features is None:
+        features = subject_features(meeting_data, mailbox)
     conf = 0.55
+    # Domain classification is shared by the +0.20 and -0.35 terms; compute it once
+    domain_generic = bool(primary_domain) and is_domain_generic(primary_domain)
 
     # +0.20 if external domain non-generic
-    if has_external_domain and primary_domain and not is_domain_generic(primary_domain):
+    if has_external_domain and primary_domain and not domain_generic:
         conf += 0.20
 
     # +0.15 if subject has org keyword
-    subject = (meeting_data.get("subject") or meeting_data.get("title") or "").strip()
-    if subject_has_org_keyword(subject):
+    if features.has_org_keyword:
         conf += 0.15
 
     # +0.10 if attendee display_name present
@@ -125,7 +166,7 @@ def compute_confidence(
         conf += 0.10
 
     # -0.35 if domain generic
-    if primary_domain and is_domain_generic(primary_domain):
+    if domain_generic:
         conf -= 0.35
 
     # -0.30 if domain root length <= 3
@@ -137,11 +178,11 @@ def compute_confidence(
         conf -= 0.25
 
     # -0.20 if subject is vague
-    if is_vague_subject(subject):
+    if features.is_vague:
         conf -= 0.20
 
     # -0.30 if meeting looks like test
-    if is_meeting_like_test(meeting_data, mailbox):
+    if features.is_test:
         conf -= 0.30
 
     return max(0.0, min(1.0, conf))
@@ -5,7 +5,9 @@ Research runs only when allow_research=True at an allowed call site (digest prev
 run-digest, digest send). Budget caps Tavily calls per request. No PII in logs.
 """
 import os
-from typing import Set
+import threading
+import time
+from typing import Optional, Set
 
 # Hard cap: never more than this many Tavily calls per digest request (preview/run-digest/digest send)
 MAX_TAVILY_CALLS_PER_REQUEST = 8
@@ -14,6 +16,13 @@ MAX_TAVILY_CALLS_PER_DIGEST = 8  # Alias for clarity in digest contexts
 # HTTP timeout for Tavily API calls (seconds). No retries.
 TAVILY_TIMEOUT_SECONDS = 10
 
+# Cross-request research result cache TTL (minutes). 0 disables; per-request dedupe always applies.
+RESEARCH_CACHE_TTL_MIN_ENV = "RESEARCH_CACHE_TTL_MIN"
+DEFAULT_RESEARCH_CACHE_TTL_MIN = 360
+
+# Proactive pacing of Tavily calls across the process (token bucket). Unset/0 = no pacing.
+TAVILY_TPS_ENV = "TAVILY_TPS"
+
 # Advanced operations (extract/map/crawl) disabled unless explicitly enabled
 ALLOW_TAVILY_ADVANCED_ENV = "TAVILY_ALLOW_ADVANCED"
 
@@ -47,6 +56,17 @@ def get_confidence_min() -> float:
         return DEFAULT_CONF_MIN
 
 
+def get_research_cache_ttl_seconds() -> int:
+    """TTL for the cross-request research cache. From env RESEARCH_CACHE_TTL_MIN, default 6h; 0 = off."""
+    raw = (os.getenv(RESEARCH_CACHE_TTL_MIN_ENV) or "").strip()
+    if not raw:
+        return DEFAULT_RESEARCH_CACHE_TTL_MIN * 60
+    try:
+        return max(0, int(raw)) * 60
+    except ValueError:
+        return DEFAULT_RESEARCH_CACHE_TTL_MIN * 60
+
+
 def env_bool(key: str, default: bool = False) -> bool:
     """Read a boolean env var consistently. True for 'true', '1', 'yes' (case-insensitive)."""
     raw = (os.getenv(key) or "").strip().lower()
@@ -82,3 +102,65 @@ class ResearchBudget:
     @property
     def remaining_calls(self) -> int:
         return max(0, self._remaining)
+
+
+class TavilyRateLimiter:
+    """
+    Token bucket pacing Tavily calls to the plan's requests/second. Shared across requests
+    in the process so concurrent digests wait their turn instead of drawing 429s.
+    Starts full: up to `burst` calls go out immediately, then one per 1/rate_per_sec seconds.
+    acquire() blocks the calling thread; the routes run context building in the threadpool
+    (run_in_threadpool), so a paced call never sleeps on the event loop.
+    """
+    __slots__ = ("_rate", "_burst", "_tokens", "_last_refill", "_lock")
+
+    def __init__(self, rate_per_sec: float, burst: int = MAX_TAVILY_CALLS_PER_DIGEST):
+        self._rate = float(rate_per_sec)
+        self._burst = float(max(1, burst))
+        self._tokens = self._burst
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Take one token, sleeping until it is available. Returns seconds waited.
+        The token is reserved under the lock and the sleep happens outside it, so waiters queue in order.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._burst, self._tokens + (now - self._last_refill) * self._rate)
+            self._last_refill = now
+            self._tokens -= 1.0
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+_tavily_rate_limiter: Optional[TavilyRateLimiter] = None
+_tavily_rate_limiter_tps: float = 0.0
+_tavily_rate_limiter_lock = threading.Lock()
+
+
+def get_tavily_tps() -> float:
+    """Tavily requests/second from env TAVILY_TPS; 0 (no pacing) when unset or invalid."""
+    raw = (os.getenv(TAVILY_TPS_ENV) or "").strip()
+    if not raw:
+        return 0.0
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        return 0.0
+
+
+def get_tavily_rate_limiter() -> Optional[TavilyRateLimiter]:
+    """Process-wide limiter for the configured TAVILY_TPS, or None when pacing is off."""
+    global _tavily_rate_limiter, _tavily_rate_limiter_tps
+    tps = get_tavily_tps()
+    if tps <= 0:
+        return None
+    with _tavily_rate_limiter_lock:
+        if _tavily_rate_limiter is None or _tavily_rate_limiter_tps != tps:
+            _tavily_rate_limiter = TavilyRateLimiter(tps)
+            _tavily_rate_limiter_tps = tps
+        return _tavily_rate_limiter
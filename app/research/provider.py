@@ -19,6 +19,7 @@ from app.research.config import (
     MAX_RESEARCH_KEYPOINTS,
     MAX_KEYPOINT_CHARS,
     allow_tavily_advanced,
+    get_tavily_rate_limiter,
 )
 
 logger = logging.getLogger(__name__)
@@ -43,6 +44,8 @@ class ResearchProvider(ABC):
                 - summary: str (short synthesized summary)
                 - key_points: List[str] (3-5 bullet points)
                 - sources: List[Dict[str, str]] (list of {title, url})
+                - _duration_ms: int, optional (provider-side call duration; callers
+                  use it for trace timings and treat a missing value as 0)
         """
         ...
 
@@ -164,6 +167,11 @@ class TavilyResearchProvider(ResearchProvider):
                 extra={"error_type": "AdvancedOperationBlocked"}
             )
             return {"summary": "", "key_points": [], "sources": []}
+        # Pace against the plan's TPS (TAVILY_TPS) rather than letting the API throttle us.
+        # Blocking wait: callers run research in a worker thread, never on the event loop.
+        limiter = get_tavily_rate_limiter()
+        if limiter is not None:
+            limiter.acquire()
         start = time.perf_counter()
         try:
             with httpx.Client(timeout=self.timeout) as client:
@@ -2,6 +2,8 @@
 Sanitize research query to avoid leaking confidential info. Do not log raw or sanitized query.
 """
 import re
+from functools import lru_cache
+
 from app.research.config import MAX_RESEARCH_QUERY_CHARS, MIN_RESEARCH_QUERY_CHARS
 
 
@@ -28,6 +30,8 @@ _CONFIDENTIAL_PHRASES = re.compile(
 )
 # Long numeric IDs/codes (6+ digits)
 _LONG_NUMERIC_PATTERN = re.compile(r"\b\d{6,}\b")
+# Any digit: phone, currency and long-ID patterns all require one (currency alternatively a comma)
+_DIGIT_PATTERN = re.compile(r"\d")
 # Collapse whitespace
 _WHITESPACE_PATTERN = re.compile(r"\s+")
 
@@ -42,15 +46,31 @@ def sanitize_research_query(raw: str) -> str:
 
     Returns:
         Sanitized string (max MAX_RESEARCH_QUERY_CHARS), or empty if nothing left.
+
+    Pure function of raw, so results are memoized: the anchor fallback ladder
+    sanitizes near-identical queries for the same meetings on every build.
+    Non-str input (including unhashable values) returns "" before reaching the cache.
     """
     if not raw or not isinstance(raw, str):
         return ""
+    return _sanitize_research_query_cached(raw)
+
+
+@lru_cache(maxsize=2048)
+def _sanitize_research_query_cached(raw: str) -> str:
+    """Memoized body of sanitize_research_query; raw is a non-empty str."""
     s = raw.strip()
-    s = _EMAIL_PATTERN.sub(" ", s)
-    s = _PHONE_PATTERN.sub(" ", s)
-    s = _CURRENCY_PATTERN.sub(" ", s)
+    # Skip passes that cannot match: typical queries ("Jane Doe" "Acme") have no '@' and no digits
+    if "@" in s:
+        s = _EMAIL_PATTERN.sub(" ", s)
+    has_digit = _DIGIT_PATTERN.search(s) is not None
+    if has_digit:
+        s = _PHONE_PATTERN.sub(" ", s)
+    if has_digit or "," in s:
+        s = _CURRENCY_PATTERN.sub(" ", s)
     s = _CONFIDENTIAL_PHRASES.sub(" ", s)
-    s = _LONG_NUMERIC_PATTERN.sub(" ", s)
+    if has_digit:
+        s = _LONG_NUMERIC_PATTERN.sub(" ", s)
     s = _WHITESPACE_PATTERN.sub(" ", s).strip()
     if len(s) > MAX_RESEARCH_QUERY_CHARS:
         s = s[:MAX_RESEARCH_QUERY_CHARS].strip()
@@ -5,6 +5,7 @@ Returned alongside research results in digest context. Do not include:
 subject, attendee emails, anchor strings, raw query string, URLs.
 """
 import hashlib
+from functools import lru_cache
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
@@ -41,6 +42,7 @@ class AnchorSource(str, Enum):
     ATTENDEE = "attendee"
 
 
+@lru_cache(maxsize=1024)
 def query_hash_prefix(query: str, length: int = 10) -> str:
     """First `length` chars of sha256(query). Non-PII identifier for logging."""
     if not query:
@@ -73,38 +75,24 @@ def build_research_trace(
     Build a ResearchTrace dict for context and logging. All fields are non-PII.
     domain_match_url is hostname only (dev). top_source_hosts, entity_match_passed for dev diagnostics.
     """
-    trace: Dict[str, Any] = {
-        "attempted": attempted,
-        "outcome": outcome,
-    }
-    if skip_reason is not None:
-        trace["skip_reason"] = skip_reason
-    if anchor_type is not None:
-        trace["anchor_type"] = anchor_type
-    if anchor_source is not None:
-        trace["anchor_source"] = anchor_source
-    if primary_domain is not None:
-        trace["primary_domain"] = primary_domain
-    if domain_match_passed is not None:
-        trace["domain_match_passed"] = domain_match_passed
-    if domain_match_url is not None:
-        trace["domain_match_url"] = domain_match_url
-    if top_source_hosts is not None:
-        trace["top_source_hosts"] = list(top_source_hosts)
-    if entity_match_passed is not None:
-        trace["entity_match_passed"] = entity_match_passed
-    if mismatch_reason is not None:
-        trace["mismatch_reason"] = mismatch_reason
-    if retry_used is not None:
-        trace["retry_used"] = retry_used
-    if confidence is not None:
-        trace["confidence"] = round(confidence, 4)
-    if query_hash is not None:
-        trace["query_hash"] = query_hash
-    if query_len is not None:
-        trace["query_len"] = query_len
-    if timings_ms is not None:
-        trace["timings_ms"] = dict(timings_ms)
-    if sources_count is not None:
-        trace["sources_count"] = sources_count
+    optional_fields = (
+        ("skip_reason", skip_reason),
+        ("anchor_type", anchor_type),
+        ("anchor_source", anchor_source),
+        ("primary_domain", primary_domain),
+        ("domain_match_passed", domain_match_passed),
+        ("domain_match_url", domain_match_url),
+        ("top_source_hosts", list(top_source_hosts) if top_source_hosts is not None else None),
+        ("entity_match_passed", entity_match_passed),
+        ("mismatch_reason", mismatch_reason),
+        ("retry_used", retry_used),
+        ("confidence", round(confidence, 4) if confidence is not None else None),
+        ("query_hash", query_hash),
+        ("query_len", query_len),
+        ("timings_ms", dict(timings_ms) if timings_ms is not None else None),
+        ("sources_count", sources_count),
+    )
+    # One pass over the optional fields; unset (None) fields are omitted from the trace
+    trace: Dict[str, Any] = {"attempted": attempted, "outcome": outcome}
+    trace.update((key, value) for key, value in optional_fields if value is not None)
     return trace
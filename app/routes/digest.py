@@ -1,14 +1,14 @@
 import os
 import uuid
 from datetime import datetime
-from zoneinfo import ZoneInfo
 
 from fastapi import APIRouter, Request, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 
 from app.schemas.digest import DigestSendRequest, DigestSendResponse
 from app.services.emailer import select_emailer_from_env
-from app.rendering.digest_renderer import render_digest_html
+from app.rendering.digest_renderer import render_digest_html, _zoneinfo
 from app.rendering.plaintext import render_plaintext
 from app.rendering.context_builder import build_digest_context_with_provider
 from app.data.sample_digest import SAMPLE_MEETINGS
@@ -22,7 +22,7 @@ router = APIRouter()
 
 
 def _today_et_str(tz_name: str) -> str:
-    tz = ZoneInfo(tz_name)
+    tz = _zoneinfo(tz_name)
     now = datetime.now(tz)
     day = str(int(now.strftime("%d")))
     return f"{now.strftime('%a')}, {now.strftime('%b')} {day}, {now.strftime('%Y')}"
@@ -90,10 +90,12 @@ async def _handle_send(request: Request, body: DigestSendRequest):
 
     data_source = body.source or "sample"
 
-    # Build context using the context builder (research allowed for digest send)
+    # Build context using the context builder (research allowed for digest send).
+    # It does blocking Graph/Tavily I/O, so it runs off the event loop.
     request_id = str(uuid.uuid4())
     research_budget = ResearchBudget(MAX_TAVILY_CALLS_PER_REQUEST)
-    context = build_digest_context_with_provider(
+    context = await run_in_threadpool(
+        build_digest_context_with_provider,
         source=data_source,
         mailbox=body.mailbox,
         allow_research=True,
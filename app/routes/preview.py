@@ -1,10 +1,13 @@
 import os
 import uuid
 from fastapi import APIRouter, Request, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import HTMLResponse, JSONResponse
 from typing import Literal, Optional
 from datetime import datetime
 
+from pydantic import BaseModel
+
 from app.rendering.digest_renderer import render_digest_html
 from app.rendering.context_builder import build_digest_context_with_provider, build_single_event_context
 from app.schemas.preview import DigestPreviewModel, MeetingModel, Attendee, Company, NewsItem
@@ -81,7 +84,7 @@ def should_run_research(request: Request, settings: dict) -> bool:
 
 def _convert_meeting_to_model(meeting: dict) -> MeetingModel:
     """Convert a meeting (dict or pydantic model) to a MeetingModel."""
-    if hasattr(meeting, "model_dump"):
+    if isinstance(meeting, BaseModel):
         meeting = meeting.model_dump()  # type: ignore[assignment]
     # Convert attendees
     attendees = []
@@ -187,7 +190,8 @@ async def _render_html_preview(
     import logging
     logger = logging.getLogger(__name__)
     
-    # Build context using shared context builder (research allowed only here and run-digest/digest send)
+    # Build context using shared context builder (research allowed only here and run-digest/digest send).
+    # It does blocking Graph/Tavily I/O, so it runs off the event loop.
     request_id = str(uuid.uuid4())
     research_budget = ResearchBudget(MAX_TAVILY_CALLS_PER_REQUEST)
     research_enabled_env = (os.getenv("RESEARCH_ENABLED") or "").strip().lower() in ("true", "1", "yes")
@@ -197,7 +201,8 @@ async def _render_html_preview(
     }
     allow_research = should_run_research(request, settings)
     logger.info(f"Building digest context: source={source}, date={date}, mailbox={mailbox}, allow_research={allow_research}")
-    context = build_digest_context_with_provider(
+    context = await run_in_threadpool(
+        build_digest_context_with_provider,
         source=source,
         date=date,
         exec_name=exec_name,
@@ -317,7 +322,8 @@ async def preview_digest_json(
     # Validate date format
     _validate_date(date)
 
-    # Build context using shared context builder (research allowed only here and run-digest/digest send)
+    # Build context using shared context builder (research allowed only here and run-digest/digest send).
+    # It does blocking Graph/Tavily I/O, so it runs off the event loop.
     request_id = str(uuid.uuid4())
     research_budget = ResearchBudget(MAX_TAVILY_CALLS_PER_REQUEST)
     research_enabled_env = (os.getenv("RESEARCH_ENABLED") or "").strip().lower() in ("true", "1", "yes")
@@ -326,7 +332,8 @@ async def preview_digest_json(
         "research_enabled": research_enabled_env,
     }
     allow_research = should_run_research(request, settings)
-    context = build_digest_context_with_provider(
+    context = await run_in_threadpool(
+        build_digest_context_with_provider,
         source=source,
         date=date,
         exec_name=exec_name,
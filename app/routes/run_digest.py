@@ -9,6 +9,7 @@ from datetime import datetime
 from zoneinfo import ZoneInfo
 
 from fastapi import APIRouter, Request, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 
@@ -60,7 +61,9 @@ async def run_digest(
 
     try:
         research_budget = ResearchBudget(MAX_TAVILY_CALLS_PER_REQUEST)
-        context = build_digest_context_with_provider(
+        # Context building does blocking Graph/Tavily I/O; run it off the event loop
+        context = await run_in_threadpool(
+            build_digest_context_with_provider,
             source=source,
             date=date,
             mailbox=mailbox,
@@ -1,19 +1,29 @@
+import threading
 import time
-from typing import Any, Dict, Optional, Tuple
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
 
 
 class TTLCache:
-    """Simple in-memory TTL cache with automatic expiration."""
+    """
+    Simple in-memory TTL cache with automatic expiration.
 
-    def __init__(self, default_ttl_seconds: int = 3600):
+    Thread-safe. When max_size is set, inserting past it first drops expired
+    entries, then evicts the least recently used ones.
+    """
+
+    def __init__(self, default_ttl_seconds: int = 3600, max_size: Optional[int] = None):
         """
         Initialize TTL cache.
 
         Args:
             default_ttl_seconds: Default TTL in seconds for cache entries
+            max_size: Maximum number of entries kept (None for unbounded)
         """
         self.default_ttl = default_ttl_seconds
-        self._cache: Dict[str, Tuple[Any, float]] = {}
+        self.max_size = max_size
+        self._cache: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
 
     def get(self, key: str) -> Optional[Any]:
         """
@@ -25,17 +35,20 @@ class TTLCache:
         Returns:
             Cached value if found and not expired, None otherwise
         """
-        if key not in self._cache:
-            return None
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
 
-        value, expiry_time = self._cache[key]
+            value, expiry_time = entry
 
-        # Check if expired
-        if time.time() > expiry_time:
-            del self._cache[key]
-            return None
+            # Check if expired
+            if time.time() > expiry_time:
+                del self._cache[key]
+                return None
 
-        return value
+            self._cache.move_to_end(key)
+            return value
 
     def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None) -> None:
         """
@@ -48,7 +61,13 @@ class TTLCache:
         """
         ttl = ttl_seconds if ttl_seconds is not None else self.default_ttl
         expiry_time = time.time() + ttl
-        self._cache[key] = (value, expiry_time)
+        with self._lock:
+            self._cache[key] = (value, expiry_time)
+            self._cache.move_to_end(key)
+            if self.max_size is not None and len(self._cache) > self.max_size:
+                self._remove_expired()
+                while len(self._cache) > self.max_size:
+                    self._cache.popitem(last=False)
 
     def delete(self, key: str) -> bool:
         """
@@ -60,14 +79,13 @@ class TTLCache:
         Returns:
             True if key was deleted, False if key didn't exist
         """
-        if key in self._cache:
-            del self._cache[key]
-            return True
-        return False
+        with self._lock:
+            return self._cache.pop(key, None) is not None
 
     def clear(self) -> None:
         """Clear all cache entries."""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
 
     def cleanup_expired(self) -> int:
         """
@@ -76,6 +94,11 @@ class TTLCache:
         Returns:
             Number of expired entries removed
         """
+        with self._lock:
+            return self._remove_expired()
+
+    def _remove_expired(self) -> int:
+        """Drop expired entries; caller holds the lock."""
         current_time = time.time()
         expired_keys = [
             key for key, (_, expiry_time) in self._cache.items()
@@ -89,12 +112,18 @@ class TTLCache:
 
     def size(self) -> int:
         """Get current number of cache entries."""
-        return len(self._cache)
+        with self._lock:
+            return len(self._cache)
 
     def keys(self) -> list[str]:
         """Get all cache keys (including expired ones)."""
-        return list(self._cache.keys())
+        with self._lock:
+            return list(self._cache.keys())
 
 
 # Global cache instance for news
 news_cache = TTLCache(default_ttl_seconds=3600)  # 1 hour default
+
+# Global cache instance for research provider results (keyed by provider + normalized query).
+# Bounded: keys are per-query, so one-off queries would otherwise pile up for the process lifetime.
+research_result_cache = TTLCache(default_ttl_seconds=6 * 3600, max_size=512)  # 6 hours default
@@ -0,0 +1,11 @@
+import pytest
+
+from app.utils.cache import research_result_cache
+
+
+@pytest.fixture(autouse=True)
+def _clear_research_result_cache():
+    """Research results are cached process-wide; keep tests independent of each other."""
+    research_result_cache.clear()
+    yield
+    research_result_cache.clear()
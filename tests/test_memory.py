@@ -7,7 +7,7 @@ import pytest
 from app.memory.service import (
     _lookback_days, _memory_max_items, _canonicalize_company_name,
     _extract_company_from_meeting, _is_past_meeting, _format_past_meeting,
-    fetch_recent_meetings, attach_memory_to_meetings
+    fetch_recent_meetings, attach_memory_to_meetings, attach_memory_to_meeting
 )
 from app.calendar.types import Event, Attendee
 
@@ -439,3 +439,38 @@ class TestAttachMemoryToMeetings:
                 assert "memory" in result[0]
                 assert "previous_meetings" in result[0]["memory"]
                 assert result[0]["memory"]["previous_meetings"] == []
+
+
+class TestAttachMemoryToSingleMeeting:
+    """Test attaching memory to a single meeting."""
+
+    def test_attach_memory_to_meeting_uses_company_key(self):
+        """Only the meeting's own company entry is attached."""
+        meeting = {
+            "subject": "RPCK × Acme Capital — Portfolio Strategy Check-in",
+            "attendees": [{"name": "John Doe", "company": "Acme Capital"}],
+        }
+        mock_memories = {
+            "Acme Capital": [{"date": "Dec 14, 2024", "subject": "Previous Meeting", "key_attendees": []}],
+            "Other Co": [{"date": "Dec 13, 2024", "subject": "Unrelated", "key_attendees": []}],
+        }
+
+        with patch('app.memory.service.fetch_recent_meetings', return_value=mock_memories):
+            with patch('app.memory.service.get_profile') as mock_profile:
+                mock_profile.return_value.company_aliases = {}
+                result = attach_memory_to_meeting(meeting)
+
+        assert result is meeting
+        assert [m["subject"] for m in result["memory"]["previous_meetings"]] == ["Previous Meeting"]
+
+    def test_attach_memory_to_meeting_without_company_skips_fetch(self):
+        """No company means no recent-meeting lookup and empty memory."""
+        meeting = {"subject": "Weekly sync", "attendees": []}
+
+        with patch('app.memory.service.fetch_recent_meetings') as mock_fetch:
+            with patch('app.memory.service.get_profile') as mock_profile:
+                mock_profile.return_value.company_aliases = {}
+                result = attach_memory_to_meeting(meeting)
+
+        mock_fetch.assert_not_called()
+        assert result["memory"] == {"previous_meetings": []}
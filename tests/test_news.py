@@ -232,6 +232,33 @@ class TestTTLCache:
         assert cache.get("key1") is None
         assert cache.get("key2") == "value2"
 
+    def test_max_size_evicts_least_recently_used(self):
+        """Test that a bounded cache evicts the least recently used entry."""
+        cache = TTLCache(default_ttl_seconds=60, max_size=2)
+
+        cache.set("key1", "value1")
+        cache.set("key2", "value2")
+        assert cache.get("key1") == "value1"  # key2 is now least recently used
+
+        cache.set("key3", "value3")
+        assert cache.size() == 2
+        assert cache.get("key2") is None
+        assert cache.get("key1") == "value1"
+        assert cache.get("key3") == "value3"
+
+    def test_max_size_drops_expired_before_evicting(self):
+        """Test that expired entries are dropped before live ones are evicted."""
+        cache = TTLCache(default_ttl_seconds=60, max_size=2)
+
+        cache.set("key1", "value1")
+        cache.set("key2", "value2", ttl_seconds=1)
+
+        # Wait for key2 to expire
+        time.sleep(1.1)
+
+        cache.set("key3", "value3")
+        assert cache.keys() == ["key1", "key3"]
+
 
 class TestNewsProviderFactory:
     """Test the news provider factory function."""
@@ -185,6 +185,49 @@ def test_per_meeting_research_dedupe(mock_provider):
                 assert len(meetings_with_research) == 2
 
 
+def test_per_meeting_research_reuses_results_across_requests(mock_provider):
+    """A second digest for the same meeting reuses the process-wide cached result (no new provider call)."""
+    with patch.dict(os.environ, {
+        "RESEARCH_ENABLED": "true",
+        "ENABLE_RESEARCH_DEV": "true",
+        "APP_ENV": "development",
+    }, clear=False):
+        mock_calendar = MagicMock()
+        mock_calendar.fetch_events.return_value = [
+            Event(
+                subject="Call with John Doe",
+                start_time="2025-09-08T10:00:00-04:00",
+                end_time="2025-09-08T11:00:00-04:00",
+                attendees=[
+                    Attendee(name="John Doe", email="john@example.com"),
+                ],
+            ),
+        ]
+
+        with patch("app.research.selector.select_research_provider", return_value=mock_provider):
+            with patch("app.rendering.context_builder.select_calendar_provider", return_value=mock_calendar):
+                for _ in range(2):
+                    context = build_digest_context_with_provider(
+                        source="live",
+                        date="2025-09-08",
+                        allow_research=True,
+                    )
+
+                assert mock_provider.get_research.call_count == 1
+                meeting = context["meetings"][0]
+                md = meeting.model_dump() if hasattr(meeting, "model_dump") else meeting
+                assert md.get("context_summary") is not None
+
+                # Disabled via env: every request goes to the provider
+                with patch.dict(os.environ, {"RESEARCH_CACHE_TTL_MIN": "0"}):
+                    build_digest_context_with_provider(
+                        source="live",
+                        date="2025-09-08",
+                        allow_research=True,
+                    )
+                assert mock_provider.get_research.call_count == 2
+
+
 def test_per_meeting_research_cap(mock_provider):
     """Test that cap works: with >8 eligible meetings, provider called at most 8."""
     with patch.dict(os.environ, {
@@ -739,3 +782,34 @@ def test_trace_domain_match_false_then_match_url_blank(mock_provider):
         assert trace.get("skip_reason") == "off_target_results"
         assert trace.get("domain_match_passed") is False
         assert trace.get("domain_match_url") is None or trace.get("domain_match_url") == ""
+
+
+def test_research_cache_key_merges_near_duplicate_queries():
+    """Case, whitespace and trailing legal-form suffixes don't split the research cache."""
+    from app.rendering.context_builder import _research_cache_key
+
+    assert _research_cache_key('"Acme Inc" CEO') == _research_cache_key('"Acme Incorporated" ceo')
+    assert _research_cache_key('"Acme, Inc."') == _research_cache_key('"acme"')
+    assert _research_cache_key('"Jane Doe" "Acme Co. Ltd"') == _research_cache_key('"Jane Doe" "Acme"')
+    assert _research_cache_key("Acme Capital") != _research_cache_key("Acme")
+    assert _research_cache_key('"Jane  Doe"   "ACME"') == _research_cache_key('"jane doe" "acme"')
+    assert _research_cache_key('"Inc."') == '"inc."'
+    assert _research_cache_key('""') == '""'
+
+
+def test_research_cache_key_keeps_distinct_entities_apart():
+    """Legal-form tokens that lead a name, stand alone, or sit outside quotes are part of the key."""
+    from app.rendering.context_builder import _research_cache_key
+
+    assert _research_cache_key('"Jane Doe" "AG Capital"') != _research_cache_key('"Jane Doe" "Capital"')
+    assert _research_cache_key('"SA Partners"') != _research_cache_key('"Partners"')
+    assert _research_cache_key('"Limited Brands"') != _research_cache_key('"Brands"')
+    assert _research_cache_key('"Company"') != _research_cache_key('""')
+    assert _research_cache_key("Acme Co") != _research_cache_key("Acme")
+    assert _research_cache_key('"Jane Doe Acme"') != _research_cache_key('"Jane Doe" "Acme"')
+    # Search operators and punctuation inside names change what the search matches
+    assert _research_cache_key('"Acme" -site:acme.com') != _research_cache_key('"Acme" site:acme.com')
+    assert _research_cache_key('"Acme" +site:acme.com') != _research_cache_key('"Acme" site:acme.com')
+    assert _research_cache_key('"C++ Labs"') != _research_cache_key('"C Labs"')
+    assert _research_cache_key('"AT&T"') != _research_cache_key('"AT T"')
+    assert _research_cache_key("AT&T") != _research_cache_key("AT T")
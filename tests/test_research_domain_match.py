@@ -0,0 +1,64 @@
+"""Tests for host-based research domain matching (single domain and ReverseDomainTrie)."""
+from app.rendering.context_builder import ReverseDomainTrie, _result_domain_match_host_based
+
+
+def _sources(*urls):
+    return [{"title": f"T{i}", "url": u} for i, u in enumerate(urls)]
+
+
+def test_host_match_exact_and_subdomain():
+    """Host equal to expected domain or a subdomain of it matches; lookalikes do not."""
+    matched, host, hosts = _result_domain_match_host_based(
+        _sources("https://notacme.com/x", "https://news.acme.com/a"), "acme.com"
+    )
+    assert matched is True
+    assert host == "news.acme.com"
+    assert hosts == ["notacme.com", "news.acme.com"]
+
+
+def test_host_match_no_match():
+    """No matching host returns (False, None, hosts)."""
+    matched, host, hosts = _result_domain_match_host_based(_sources("https://other.com"), "acme.com")
+    assert (matched, host, hosts) == (False, None, ["other.com"])
+
+
+def test_reverse_domain_trie_match():
+    """Trie returns the deepest registered suffix; leading-dot domains match subdomains only."""
+    trie = ReverseDomainTrie(["acme.com", "eu.acme.com", ".beta.org"])
+    assert len(trie) == 3
+    assert trie.match("acme.com") == "acme.com"
+    assert trie.match("www.acme.com") == "acme.com"
+    assert trie.match("shop.eu.acme.com") == "eu.acme.com"
+    assert trie.match("notacme.com") is None
+    assert trie.match("beta.org") is None
+    assert trie.match("www.beta.org") == ".beta.org"
+
+
+def test_host_match_with_trie_matches_any_expected_domain():
+    """Passing a trie matches against every registered domain."""
+    trie = ReverseDomainTrie(["acme.com", "betacorp.com"])
+    matched, host, _ = _result_domain_match_host_based(
+        _sources("https://example.org", "https://ir.betacorp.com/q3"), trie
+    )
+    assert matched is True
+    assert host == "ir.betacorp.com"
+
+
+def test_host_match_empty_expected():
+    """Empty expected domain or empty trie never matches."""
+    assert _result_domain_match_host_based(_sources("https://acme.com"), "") == (False, None, [])
+    assert _result_domain_match_host_based(_sources("https://acme.com"), ReverseDomainTrie()) == (False, None, [])
+
+
+def test_host_from_url_strips_userinfo_port_and_path():
+    from app.rendering.context_builder import _host_from_url
+
+    assert _host_from_url("https://WWW.Example.com/a?b") == "www.example.com"
+    assert _host_from_url("http://user:pw@host.io:8080/x") == "host.io"
+    assert _host_from_url("http://a@b@host.io/x") == "host.io"
+    assert _host_from_url("https://[::1]:80/") == "::1"
+    assert _host_from_url("https://a.com#frag") == "a.com"
+    assert _host_from_url("//cdn.example.com/x") == "cdn.example.com"
+    assert _host_from_url("") == ""
+    assert _host_from_url(None) == ""
+    assert _host_from_url(["https://a.com"]) == ""
@@ -210,6 +210,13 @@ def test_sanitize_research_query_enforces_max_length():
     assert len(out) <= MAX_RESEARCH_QUERY_CHARS
 
 
+def test_sanitize_research_query_non_str_returns_empty():
+    """Non-str input (including unhashable values) yields "" rather than a cache TypeError."""
+    assert sanitize_research_query(None) == ""
+    assert sanitize_research_query(["Acme Corp"]) == ""
+    assert sanitize_research_query({"q": "Acme Corp"}) == ""
+
+
 def test_sanitize_research_query_empty_or_too_short_not_usable():
     """Empty or very short sanitized query is not usable."""
     assert is_query_usable_after_sanitization("") is False
@@ -246,3 +253,40 @@ def test_search_operation_allowed_by_default():
     assert "summary" in result
     assert "key_points" in result
     assert "sources" in result
+
+
+# ---- Tavily pacing: token bucket (TAVILY_TPS) ----
+
+def test_tavily_rate_limiter_burst_then_paced(monkeypatch):
+    """Limiter lets `burst` calls through immediately, then waits ~1/rate per call."""
+    import app.research.config as research_config
+    from app.research.config import TavilyRateLimiter
+
+    clock = {"now": 100.0}
+    slept = []
+    monkeypatch.setattr(research_config.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(research_config.time, "sleep", lambda s: slept.append(s))
+
+    limiter = TavilyRateLimiter(rate_per_sec=4.0, burst=2)
+    assert limiter.acquire() == 0.0
+    assert limiter.acquire() == 0.0
+    assert limiter.acquire() == pytest.approx(0.25)
+    assert slept == [pytest.approx(0.25)]
+
+    # After a second the bucket has refilled (capped at burst)
+    clock["now"] += 1.0
+    assert limiter.acquire() == 0.0
+
+
+def test_tavily_rate_limiter_disabled_without_env(monkeypatch):
+    """No TAVILY_TPS (or 0/invalid) means no pacing; a value returns one shared limiter."""
+    from app.research.config import get_tavily_rate_limiter
+
+    monkeypatch.delenv("TAVILY_TPS", raising=False)
+    assert get_tavily_rate_limiter() is None
+    monkeypatch.setenv("TAVILY_TPS", "abc")
+    assert get_tavily_rate_limiter() is None
+    monkeypatch.setenv("TAVILY_TPS", "5")
+    limiter = get_tavily_rate_limiter()
+    assert limiter is not None
+    assert get_tavily_rate_limiter() is limiter
@@ -240,6 +240,11 @@ def test_meeting_marked_test_skipped(monkeypatch):
     assert meeting_trace.get("skip_reason") == SkipReason.MEETING_MARKED_TEST.value
     assert provider.call_count == 0
 
+    # Each attach is a fresh copy: mutating one digest's trace can't leak into the next
+    meeting_trace["timings_ms"]["tavily_ms"] = 999
+    from app.rendering.context_builder import _TRACE_MEETING_MARKED_TEST
+    assert _TRACE_MEETING_MARKED_TEST["timings_ms"]["tavily_ms"] == 0
+
 
 def test_budget_still_enforced_one_call_max(monkeypatch):
     """MAX_TAVILY_CALLS_PER_REQUEST is now 8; budget enforces at most 8 provider calls."""